@@ -1,6 +1,12 @@
+import hashlib
+import hmac
+import importlib.util
 import math
+import numpy as np
 import streamlit as st
-import streamlit.components.v1 as components  # needed for the updated results section
+
+# numba is optional; it is imported only when the pricing kernel is compiled
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
 # =========================================================
 # Cybastion × RiskCare
@@ -13,99 +19,335 @@ P_MAX = 0.20   # 20% - fixed
 X0 = 60.0      # Inflection point
 K = 0.08       # Curve steepness
 
+# -----------------------------
+# Static markup
+# -----------------------------
+# Page-wide styles
+_CSS_HTML = """
+<style>
+/* Main background gradient */
+.stApp {
+    background: linear-gradient(to bottom, #f8f9fa 0%, #e9ecef 100%);
+}
+
+/* Header styling */
+.header-container {
+    padding: 30px 40px;
+    background: white;
+    border-radius: 15px;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+    margin-bottom: 30px;
+}
+
+.brand-row {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 20px;
+}
+
+.brand-left {
+    font-size: 16px;
+    font-weight: 700;
+    color: #000000;
+}
+
+.brand-right {
+    font-size: 16px;
+    font-weight: 700;
+    color: #000000;
+}
+
+.app-title {
+    font-size: 36px;
+    font-weight: 700;
+    color: #2c3e50;
+    text-align: center;
+}
+
+/* Card styling */
+.info-card {
+    background: white;
+    padding: 25px;
+    border-radius: 12px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+    margin-bottom: 20px;
+}
+
+/* Metric containers */
+.stMetric {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 20px;
+    border-radius: 10px;
+    color: white;
+}
+
+.stMetric label {
+    color: white !important;
+    font-weight: 600;
+}
+
+.stMetric .metric-value {
+    color: white !important;
+    font-size: 28px !important;
+    font-weight: 700 !important;
+}
+
+/* Slider styling */
+.stSlider {
+    padding: 10px 0;
+}
+
+/* Number input styling */
+.stNumberInput > div > div > input {
+    border-radius: 8px;
+    border: 2px solid #e9ecef;
+    padding: 10px;
+}
+
+/* Results section */
+.results-header {
+    font-size: 26px;
+    font-weight: 700;
+    color: #2c3e50;
+    text-align: center;
+    margin: 30px 0 20px 0;
+    padding: 15px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+}
+
+/* Premium quote metric cards */
+.metric-grid {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 16px;
+    margin-top: 8px;
+    margin-bottom: 20px;
+}
+
+.metric-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    border-radius: 10px;
+    padding: 18px 16px;
+    color: white;
+    box-sizing: border-box;
+    overflow: hidden;
+    container-type: inline-size;
+}
+
+.metric-label {
+    font-size: 14px;
+    font-weight: 700;
+    opacity: 0.95;
+    margin-bottom: 10px;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
+
+/* Shrink long values to the card width: --chars is the value's length */
+.metric-value {
+    font-weight: 800;
+    font-size: clamp(14px, calc(160cqi / var(--chars, 10)), 30px);
+    line-height: 1.1;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    font-variant-numeric: tabular-nums;
+}
+
+.metric-help {
+    margin-top: 10px;
+    font-size: 12px;
+    opacity: 0.9;
+    line-height: 1.3;
+}
+
+/* Responsive stacking on small screens */
+@media (max-width: 740px) {
+    .metric-grid { grid-template-columns: 1fr; }
+}
+
+/* Notice box */
+.notice-box {
+    background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
+    padding: 20px;
+    border-radius: 12px;
+    border-left: 5px solid #2196f3;
+    margin: 20px 0;
+}
+
+.notice-title {
+    font-size: 18px;
+    font-weight: 700;
+    color: #1565c0;
+    margin-bottom: 10px;
+}
+
+.notice-text {
+    color: #424242;
+    line-height: 1.6;
+}
+
+/* Footer */
+.footer {
+    text-align: center;
+    padding: 20px;
+    color: #6c757d;
+    font-size: 14px;
+    margin-top: 40px;
+}
+</style>
+"""
+
+# Header with brands and app title
+_HEADER_HTML = """
+<div class="header-container">
+    <div class="brand-row">
+        <div class="brand-left">Cybastion</div>
+        <div class="brand-right">RiskCare</div>
+    </div>
+    <div class="app-title">Cyber Insurance Pricing App</div>
+</div>
+"""
+
+# Introduction card under the header
+_INTRO_HTML = """
+<div class="info-card">
+    <p style="font-size: 16px; line-height: 1.8; color: #495057; margin: 0;">
+    This application generates <strong>cyber insurance quotes</strong> based on a nonlinear,
+    score-driven actuarial pricing model.
+    Premium rates are determined by the insured organization's Cybersecurity Score.
+    </p>
+</div>
+"""
+
+# Binding quote notice under the results
+_NOTICE_HTML = """
+<div class="notice-box">
+    <div class="notice-title">Premium Quote Notice</div>
+    <div class="notice-text">
+        The premium displayed above constitutes a <strong>cyber insurance quote</strong>, subject only to:
+        <ul style="margin-top: 10px;">
+            <li>Policy terms and conditions</li>
+            <li>Standard exclusions</li>
+            <li>Verification that no material misrepresentation exists in the provided cybersecurity information</li>
+        </ul>
+        No discretionary pricing adjustments apply beyond the model defined herein.
+    </div>
+</div>
+"""
+
+# Page footer
+_FOOTER_HTML = """
+<div class="footer">
+    © 2026 Cybastion × RiskCare — Cyber Insurance Pricing App - Basic Version
+</div>
+"""
+
+# Login card shown by check_password() (first attempt and retry share it)
+_LOGIN_HTML = """
+<style>
+.login-container {
+    max-width: 500px;
+    margin: 100px auto;
+    padding: 40px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    border-radius: 15px;
+    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+}
+.login-title {
+    color: white;
+    text-align: center;
+    font-size: 28px;
+    font-weight: 600;
+    margin-bottom: 30px;
+}
+</style>
+<div class="login-container">
+    <div class="login-title">🔐 Secure Access Required</div>
+</div>
+"""
+
+def _premium_rate_kernel(X):
+    """Sigmoid pricing curve for a single score (plain math, JIT-compatible)."""
+    X = 0.0 if X < 0.0 else (100.0 if X > 100.0 else X)
+    return P_MIN + (P_MAX - P_MIN) / (1.0 + math.exp(K * (X - X0)))
+
+# Plain-Python kernel until the numba build is swapped in after login
+_premium_rate_scalar = _premium_rate_kernel
+
+@st.cache_resource(show_spinner=False)
+def _compiled_premium_rate():
+    """numba-compiled _premium_rate_kernel, built once per server process after the first login."""
+    from numba import njit
+
+    kernel = njit(_premium_rate_kernel)
+    kernel(X0)  # warm up so the first quote does not pay the compile cost
+    return kernel
+
 def premium_rate(X: float) -> float:
     """
     Binding premium rate using a fixed sigmoid pricing curve.
     """
-    X = max(0.0, min(100.0, float(X)))
-    return P_MIN + (P_MAX - P_MIN) / (1 + math.exp(K * (X - X0)))
+    return _premium_rate_scalar(float(X))
+
+def premium_rate_curve(xs) -> np.ndarray:
+    """
+    Vectorised premium_rate over an array of scores, e.g. for premium-vs-score plots.
+    """
+    xs = np.clip(np.asarray(xs, dtype=np.float64), 0.0, 100.0)
+    return P_MIN + (P_MAX - P_MIN) / (1.0 + np.exp(K * (xs - X0)))
+
+@st.cache_resource(show_spinner=False)
+def _password_hash() -> bytes:
+    """
+    SHA-256 digest of the access password, read once from the `pw_sha256` secret.
+    Raises FileNotFoundError / KeyError / ValueError if it is missing or malformed (not cached).
+    """
+    return bytes.fromhex(st.secrets["pw_sha256"])
 
 def check_password():
     """Returns `True` if the user had the correct password."""
     
     def password_entered():
         """Checks whether a password entered by the user is correct."""
-        if st.session_state["password"] == "Cybastion2025":
+        entered = st.session_state["password"].encode()
+        # Constant-time comparison of digests, so the password is never kept in source
+        if hmac.compare_digest(hashlib.sha256(entered).digest(), _password_hash()):
             st.session_state["password_correct"] = True
             del st.session_state["password"]  # Don't store password
         else:
             st.session_state["password_correct"] = False
 
-    if "password_correct" not in st.session_state:
-        # First run, show input for password
-        st.markdown(
-            """
-            <style>
-            .login-container {
-                max-width: 500px;
-                margin: 100px auto;
-                padding: 40px;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                border-radius: 15px;
-                box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-            }
-            .login-title {
-                color: white;
-                text-align: center;
-                font-size: 28px;
-                font-weight: 600;
-                margin-bottom: 30px;
-            }
-            </style>
-            <div class="login-container">
-                <div class="login-title">🔐 Secure Access Required</div>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-        st.text_input(
-            "Please enter your access password:", 
-            type="password", 
-            on_change=password_entered, 
-            key="password",
-            label_visibility="visible"
-        )
-        return False
-    elif not st.session_state["password_correct"]:
-        # Password incorrect, show input + error
-        st.markdown(
-            """
-            <style>
-            .login-container {
-                max-width: 500px;
-                margin: 100px auto;
-                padding: 40px;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                border-radius: 15px;
-                box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-            }
-            .login-title {
-                color: white;
-                text-align: center;
-                font-size: 28px;
-                font-weight: 600;
-                margin-bottom: 30px;
-            }
-            </style>
-            <div class="login-container">
-                <div class="login-title">🔐 Secure Access Required</div>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-        st.text_input(
-            "Please enter your access password:", 
-            type="password", 
-            on_change=password_entered, 
-            key="password",
-            label_visibility="visible"
-        )
-        st.error("❌ Incorrect password. Please try again.")
-        return False
-    else:
+    if st.session_state.get("password_correct"):
         # Password correct
         return True
 
+    # Fail closed: without a configured password hash nobody gets in
+    try:
+        _password_hash()
+    except (FileNotFoundError, KeyError, ValueError):
+        st.error("Access is not configured. Set `pw_sha256` in `.streamlit/secrets.toml`.")
+        return False
+
+    # First run or incorrect password: show the login card and input
+    st.markdown(_LOGIN_HTML, unsafe_allow_html=True)
+    st.text_input(
+        "Please enter your access password:", 
+        type="password", 
+        on_change=password_entered, 
+        key="password",
+        label_visibility="visible"
+    )
+    if "password_correct" in st.session_state:
+        # A password was entered and rejected
+        st.error("❌ Incorrect password. Please try again.")
+    return False
+
 # -----------------------------
 # Streamlit Configuration
 # -----------------------------
@@ -116,172 +358,26 @@ st.set_page_config(
 )
 
 # Custom CSS for enhanced styling
-st.markdown(
-    """
-    <style>
-    /* Main background gradient */
-    .stApp {
-        background: linear-gradient(to bottom, #f8f9fa 0%, #e9ecef 100%);
-    }
-    
-    /* Header styling */
-    .header-container {
-        padding: 30px 40px;
-        background: white;
-        border-radius: 15px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        margin-bottom: 30px;
-    }
-    
-    .brand-row {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 20px;
-    }
-    
-    .brand-left {
-        font-size: 16px;
-        font-weight: 700;
-        color: #000000;
-    }
-    
-    .brand-right {
-        font-size: 16px;
-        font-weight: 700;
-        color: #000000;
-    }
-    
-    .app-title {
-        font-size: 36px;
-        font-weight: 700;
-        color: #2c3e50;
-        text-align: center;
-    }
-    
-    /* Card styling */
-    .info-card {
-        background: white;
-        padding: 25px;
-        border-radius: 12px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        margin-bottom: 20px;
-    }
-    
-    /* Metric containers */
-    .stMetric {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-    }
-    
-    .stMetric label {
-        color: white !important;
-        font-weight: 600;
-    }
-    
-    .stMetric .metric-value {
-        color: white !important;
-        font-size: 28px !important;
-        font-weight: 700 !important;
-    }
-    
-    /* Slider styling */
-    .stSlider {
-        padding: 10px 0;
-    }
-    
-    /* Number input styling */
-    .stNumberInput > div > div > input {
-        border-radius: 8px;
-        border: 2px solid #e9ecef;
-        padding: 10px;
-    }
-    
-    /* Results section */
-    .results-header {
-        font-size: 26px;
-        font-weight: 700;
-        color: #2c3e50;
-        text-align: center;
-        margin: 30px 0 20px 0;
-        padding: 15px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    /* Notice box */
-    .notice-box {
-        background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
-        padding: 20px;
-        border-radius: 12px;
-        border-left: 5px solid #2196f3;
-        margin: 20px 0;
-    }
-    
-    .notice-title {
-        font-size: 18px;
-        font-weight: 700;
-        color: #1565c0;
-        margin-bottom: 10px;
-    }
-    
-    .notice-text {
-        color: #424242;
-        line-height: 1.6;
-    }
-    
-    /* Footer */
-    .footer {
-        text-align: center;
-        padding: 20px;
-        color: #6c757d;
-        font-size: 14px;
-        margin-top: 40px;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+# (re-emitted on every run: Streamlit drops elements a rerun does not draw)
+st.markdown(_CSS_HTML, unsafe_allow_html=True)
 
 # Check password before showing main app
 if not check_password():
     st.stop()
 
+# Resolved once per run, after login, so the login page never loads numba
+if NUMBA_AVAILABLE:
+    _premium_rate_scalar = _compiled_premium_rate()
+
 # -----------------------------
 # Main Application UI
 # -----------------------------
 
 # Header with brands and app title
-st.markdown(
-    """
-    <div class="header-container">
-        <div class="brand-row">
-            <div class="brand-left">Cybastion</div>
-            <div class="brand-right">RiskCare</div>
-        </div>
-        <div class="app-title">Cyber Insurance Pricing App</div>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # Introduction card
-st.markdown(
-    """
-    <div class="info-card">
-        <p style="font-size: 16px; line-height: 1.8; color: #495057; margin: 0;">
-        This application generates <strong>cyber insurance quotes</strong> based on a nonlinear,
-        score-driven actuarial pricing model.
-        Premium rates are determined by the insured organization's Cybersecurity Score.
-        </p>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(_INTRO_HTML, unsafe_allow_html=True)
 
 # Input section
 #st.markdown("<div class='info-card'>", unsafe_allow_html=True)
@@ -314,7 +410,6 @@ Z = st.number_input(
     format="%.2f",
     help="The maximum amount the policy will pay in the event of a covered cyber incident"
 )
-st.markdown("</div>", unsafe_allow_html=True)
 
 # Calculation
 Y = premium_rate(X)
@@ -329,132 +424,31 @@ rate_str = f"{Y*100:.2f}%"
 coverage_str = f"${Z:,.2f}"
 premium_str = f"${premium_amount:,.2f}"
 
-components.html(
-    f"""
-    <style>
-      .metric-grid {{
-        display: grid;
-        grid-template-columns: repeat(3, 1fr);
-        gap: 16px;
-        margin-top: 8px;
-      }}
-      .metric-card {{
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 10px;
-        padding: 18px 16px;
-        color: white;
-        box-sizing: border-box;
-        overflow: hidden;
-      }}
-      .metric-label {{
-        font-size: 14px;
-        font-weight: 700;
-        opacity: 0.95;
-        margin-bottom: 10px;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-      }}
-      .metric-value {{
-        font-weight: 800;
-        font-size: 30px;           /* start big, JS will shrink if needed */
-        line-height: 1.1;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-        font-variant-numeric: tabular-nums;
-      }}
-      .metric-help {{
-        margin-top: 10px;
-        font-size: 12px;
-        opacity: 0.9;
-        line-height: 1.3;
-      }}
-
-      /* Responsive stacking on small screens */
-      @media (max-width: 740px) {{
-        .metric-grid {{ grid-template-columns: 1fr; }}
-      }}
-    </style>
-
-    <div class="metric-grid" id="metricGrid">
-      <div class="metric-card">
-        <div class="metric-label">Premium Rate (%)</div>
-        <div class="metric-value fitme">{rate_str}</div>
-        <div class="metric-help">Percentage of coverage amount</div>
-      </div>
-
-      <div class="metric-card">
-        <div class="metric-label">Coverage Amount (US Dollars)</div>
-        <div class="metric-value fitme">{coverage_str}</div>
-        <div class="metric-help">Maximum policy payout</div>
-      </div>
-
-      <div class="metric-card">
-        <div class="metric-label">Total Premium (US Dollars)</div>
-        <div class="metric-value fitme">{premium_str}</div>
-        <div class="metric-help">Annual premium due</div>
-      </div>
-    </div>
-
-    <script>
-      function fitText(el, minPx, maxPx) {{
-        el.style.fontSize = maxPx + "px";
-        const parent = el.parentElement;
-        if (!parent) return;
-
-        const maxWidth = parent.clientWidth - 8;
-
-        let size = maxPx;
-        while (el.scrollWidth > maxWidth && size > minPx) {{
-          size -= 1;
-          el.style.fontSize = size + "px";
-        }}
-      }}
-
-      function runFit() {{
-        const els = document.querySelectorAll('.fitme');
-        els.forEach(el => fitText(el, 14, 30));
-      }}
-
-      setTimeout(runFit, 0);
-      setTimeout(runFit, 50);
-      setTimeout(runFit, 200);
-
-      window.addEventListener('resize', () => {{
-        setTimeout(runFit, 50);
-      }});
-    </script>
-    """,
-    height=410,          # increased height so all 3 cards show
-    scrolling=False
-)
-
-# Binding quote notice
 st.markdown(
-    """
-    <div class="notice-box">
-        <div class="notice-title">Premium Quote Notice</div>
-        <div class="notice-text">
-            The premium displayed above constitutes a <strong>cyber insurance quote</strong>, subject only to:
-            <ul style="margin-top: 10px;">
-                <li>Policy terms and conditions</li>
-                <li>Standard exclusions</li>
-                <li>Verification that no material misrepresentation exists in the provided cybersecurity information</li>
-            </ul>
-            No discretionary pricing adjustments apply beyond the model defined herein.
+    f"""
+    <div class="metric-grid">
+        <div class="metric-card">
+            <div class="metric-label">Premium Rate (%)</div>
+            <div class="metric-value" style="--chars: {len(rate_str)}">{rate_str}</div>
+            <div class="metric-help">Percentage of coverage amount</div>
+        </div>
+        <div class="metric-card">
+            <div class="metric-label">Coverage Amount (US Dollars)</div>
+            <div class="metric-value" style="--chars: {len(coverage_str)}">{coverage_str}</div>
+            <div class="metric-help">Maximum policy payout</div>
+        </div>
+        <div class="metric-card">
+            <div class="metric-label">Total Premium (US Dollars)</div>
+            <div class="metric-value" style="--chars: {len(premium_str)}">{premium_str}</div>
+            <div class="metric-help">Annual premium due</div>
         </div>
     </div>
     """,
     unsafe_allow_html=True
 )
 
+# Binding quote notice
+st.markdown(_NOTICE_HTML, unsafe_allow_html=True)
+
 # Footer
-st.markdown(
-    """
-    <div class="footer">
-        © 2026 Cybastion × RiskCare — Cyber Insurance Pricing App - Basic Version
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
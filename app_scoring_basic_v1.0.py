@@ -1,23 +1,58 @@
+import importlib.util
+import textwrap
+import time
+
+import numpy as np
+import pandas as pd
 import streamlit as st
 from io import BytesIO
-from datetime import datetime
 
-# Try to import reportlab for PDF generation
-try:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import A4
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# Check for reportlab without importing it; generate_pdf imports it on first use
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+# numba is optional; when present it is imported only to compile the scoring kernel
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
 
 # ---------------------------------------------------------
 # Helper functions for scoring
 # ---------------------------------------------------------
 
-def yes_no_score(answer: str, yes_value: int = 100, no_value: int = 0) -> float:
-    """Map a Yes/No answer to a numeric score."""
-    return yes_value if answer == "Yes" else no_value
+# Reporting / simulation frequency -> maturity score (higher frequency => higher score)
+_FREQ_SCORE = {
+    "Ad hoc / not defined": 20,
+    "Annually": 40,
+    "Quarterly": 70,
+    "Monthly": 90,
+    "Weekly or more often": 100,
+}
+
+# Backup frequency -> score
+_BACKUP_SCORE = {
+    "No regular backups": 0,
+    "Monthly": 40,
+    "Weekly": 70,
+    "Daily or more often": 100,
+}
+
+# Risk factor per sector (1 = very high risk)
+_SECTOR_RISK = {
+    "Water and Energy (electricity, gas, oil, water)": 0.9,
+    "Financial institution (bank, insurance, microfinance, collection, etc.)": 0.9,
+    "Sports betting / gambling": 0.8,
+    "Telecommunications / new technologies": 0.85,
+    "Healthcare / medical / provident fund": 0.9,
+    "Commerce / agro-industry": 0.7,
+    "Other": 0.6,
+}
+
+# Sector -> inherent risk score, precomputed as (1 - risk_factor)*100
+_SECTOR_SCORE = {sector: max(0.0, (1 - factor) * 100) for sector, factor in _SECTOR_RISK.items()}
+_DEFAULT_SECTOR_SCORE = _SECTOR_SCORE["Other"]
+
+# Number of selected data types (6 options) / coverage options (7 options) -> score
+_SENS_LUT = tuple((1 - n / 6) * 100 for n in range(7))
+_COV_LUT = tuple((n / 7) * 100 for n in range(8))
 
 
 def frequency_score(freq: str) -> float:
@@ -25,72 +60,42 @@ def frequency_score(freq: str) -> float:
     Map reporting / simulation frequency to a maturity score.
     Higher frequency => higher score.
     """
-    mapping = {
-        "Ad hoc / not defined": 20,
-        "Annually": 40,
-        "Quarterly": 70,
-        "Monthly": 90,
-        "Weekly or more often": 100,
-    }
-    return mapping.get(freq, 0)
+    return _FREQ_SCORE.get(freq, 0)
 
 
 def backup_frequency_score(freq: str) -> float:
     """Score backup frequency."""
-    mapping = {
-        "No regular backups": 0,
-        "Monthly": 40,
-        "Weekly": 70,
-        "Daily or more often": 100,
-    }
-    return mapping.get(freq, 0)
+    return _BACKUP_SCORE.get(freq, 0)
 
 
 def sector_inherent_risk_score(sectors) -> float:
     """
     Compute an inherent risk score based on sectors of activity.
     Higher inherent risk -> lower score.
-    We convert risk_factor in [0,1] to score = (1 - risk_factor)*100.
+    Each sector maps to a precomputed score = (1 - risk_factor)*100; we average them.
     """
     if not sectors:
         # No sensitive sector selected -> assume low inherent risk
         return 100.0
 
-    # Risk factor per sector (1 = very high risk)
-    risk_map = {
-        "Water and Energy (electricity, gas, oil, water)": 0.9,
-        "Financial institution (bank, insurance, microfinance, collection, etc.)": 0.9,
-        "Sports betting / gambling": 0.8,
-        "Telecommunications / new technologies": 0.85,
-        "Healthcare / medical / provident fund": 0.9,
-        "Commerce / agro-industry": 0.7,
-        "Other": 0.6,
-    }
-
-    factors = [risk_map.get(s, 0.6) for s in sectors]
-    avg_factor = sum(factors) / len(factors)
-    return max(0, (1 - avg_factor) * 100)
+    vals = [_SECTOR_SCORE.get(s, _DEFAULT_SECTOR_SCORE) for s in sectors]
+    return sum(vals) / len(vals)
 
 
 def data_sensitivity_score(selected_types) -> float:
     """
     More categories of sensitive data => higher exposure => lower score.
-    We keep it simple: score = (1 - n_types / max_types)*100.
+    We keep it simple: score = (1 - n_types / max_types)*100, looked up by n_types.
     """
-    max_types = 6  # number of options
-    n = len(selected_types)
-    exposure = min(1.0, n / max_types)
-    return max(0, (1 - exposure) * 100)
+    return _SENS_LUT[min(len(selected_types), 6)]
 
 
 def coverage_awareness_score(options) -> float:
     """
     Interpret broader requested coverage as a proxy for awareness and maturity.
-    More options selected => higher score.
+    More options selected => higher score, looked up by the number of options.
     """
-    max_opts = 7  # number of options
-    n = len(options)
-    return (n / max_opts) * 100 if max_opts > 0 else 0
+    return _COV_LUT[min(len(options), 7)]
 
 
 # Section weights (sum to 1.0)
@@ -108,50 +113,224 @@ SECTION_WEIGHTS = {
     "L": 0.02,  # Mobile devices & BYOD
 }
 
+# Section order and matching weight vector, computed once at import
+_SEC_ORDER = tuple(SECTION_WEIGHTS)
+_WEIGHTS = np.array([SECTION_WEIGHTS[sec] for sec in _SEC_ORDER])
+
+# Items of the sections scored as a plain mean, in section order:
+# (section, response key, score if "Yes", score if "No").
+# Ordinal items (frequency selectboxes) are scored via _ORDINAL_SCORERS instead.
+_ITEM_SCHEMA = (
+    # Section C: Organisation and security policies
+    ("C", "C_infosec_policy", 100, 0),           # formal infosec policy
+    ("C", "C_privacy_policy", 100, 0),           # up-to-date privacy policy
+    ("C", "C_training", 100, 0),                 # regular cyber training
+    ("C", "C_encryption", 100, 0),               # electronic data encrypted
+    ("C", "C_access_revocation", 100, 0),        # prompt access revocation
+    ("C", "C_pentesting", 100, 0),               # periodic penetration/vuln tests
+    ("C", "C_patch_management", 100, 0),         # quick remediation of vulnerabilities
+    # Section D: Infrastructure & IT controls
+    ("D", "D_firewall_ids", 100, 0),             # firewalls & IDS/IPS
+    ("D", "D_malware_protection", 100, 0),       # malware protection
+    ("D", "D_mfa", 100, 0),                      # multi-factor auth
+    ("D", "D_endpoint_security", 100, 0),        # endpoint protection
+    ("D", "D_backup_freq", 0, 0),                # backup frequency (ordinal)
+    # Section E: Incident response & history
+    ("E", "E_ir_plan", 100, 0),                  # incident response plan
+    ("E", "E_incidents_5y", 100, 40),            # incidents in last 5 years
+    ("E", "E_potential_claims", 100, 30),        # events that could lead to a claim
+    # Section H: Supplier & third-party security
+    ("H", "H_supplier_access", 70, 100),
+    ("H", "H_thirdparty_policy", 100, 0),
+    ("H", "H_contract_clauses", 100, 0),
+    ("H", "H_update_policy", 100, 0),
+    # Section I: Security indicators & monitoring
+    ("I", "I_dashboards", 100, 0),
+    ("I", "I_reporting_freq", 0, 0),             # reporting frequency (ordinal)
+    # Section J: Tests & audits
+    ("J", "J_external_audit", 100, 0),
+    ("J", "J_results_to_management", 100, 0),
+    # Section K: Awareness & security culture
+    ("K", "K_risky_behaviour_policy", 100, 0),
+    ("K", "K_phishing_sims", 100, 0),
+    ("K", "K_phishing_freq", 0, 0),              # phishing simulation frequency (ordinal)
+    # Section L: Mobile devices & BYOD
+    ("L", "L_byod_policy", 100, 0),
+    ("L", "L_personal_device_security", 100, 0),
+)
+
+_ORDINAL_SCORERS = {
+    "D_backup_freq": backup_frequency_score,
+    "I_reporting_freq": frequency_score,
+    "K_phishing_freq": frequency_score,
+}
+
+# Precomputed arrays so each submit is a handful of NumPy operations
+_ITEM_KEYS = tuple(item[1] for item in _ITEM_SCHEMA)
+_ITEM_YES = np.array([item[2] for item in _ITEM_SCHEMA], dtype=np.int16)
+_ITEM_NO = np.array([item[3] for item in _ITEM_SCHEMA], dtype=np.int16)
+_ORDINAL_ITEMS = tuple(
+    (_ITEM_KEYS.index(key), key, scorer) for key, scorer in _ORDINAL_SCORERS.items()
+)
+
+_AVERAGED_SECTIONS = "CDEHIJKL"
+_item_sections = [item[0] for item in _ITEM_SCHEMA]
+_SECTION_STARTS = np.array([_item_sections.index(sec) for sec in _AVERAGED_SECTIONS])
+_SECTION_LENGTHS = np.array([_item_sections.count(sec) for sec in _AVERAGED_SECTIONS])
+
+# Every questionnaire answer (A–L), in the order shown in the PDF report
+_ALL_KEYS = (
+    "A_company_name",
+    "A_address",
+    "A_websites",
+    "A_activity",
+    "A_employees",
+    "A_revenue",
+    "A_years",
+    "A_primary_contact",
+    "B_types",
+    "C_infosec_policy",
+    "C_privacy_policy",
+    "C_training",
+    "C_encryption",
+    "C_encryption_details",
+    "C_access_revocation",
+    "C_pentesting",
+    "C_patch_management",
+    "D_firewall_ids",
+    "D_malware_protection",
+    "D_mfa",
+    "D_endpoint_security",
+    "D_backup_freq",
+    "D_backup_location",
+    "E_ir_plan",
+    "E_incidents_5y",
+    "E_incident_details",
+    "E_potential_claims",
+    "E_claim_details",
+    "F_sectors",
+    "F_other",
+    "G_amount",
+    "G_options",
+    "H_supplier_access",
+    "H_thirdparty_policy",
+    "H_contract_clauses",
+    "H_update_policy",
+    "H_software_list",
+    "I_dashboards",
+    "I_reporting_freq",
+    "J_external_audit",
+    "J_last_audit_date",
+    "J_results_to_management",
+    "K_risky_behaviour_policy",
+    "K_phishing_sims",
+    "K_phishing_freq",
+    "L_byod_policy",
+    "L_personal_device_security",
+)
+
+# Answers that feed the score (B–L)
+_SCORING_KEYS = ("B_types", "F_sectors", "G_options") + _ITEM_KEYS
+
+# Yes / No questions (C–L), shown together in one editable table
+_YES_NO_QUESTIONS = {
+    "C_infosec_policy": "Do you have a formal information security policy?",
+    "C_privacy_policy": "Do you have an up-to-date privacy policy?",
+    "C_training": "Do employees receive regular cybersecurity awareness training?",
+    "C_encryption": "Are electronic data encrypted (at rest and/or in transit)?",
+    "C_access_revocation": "Are user access rights removed promptly when staff leave or change roles?",
+    "C_pentesting": "Do you perform periodic penetration tests or vulnerability assessments?",
+    "C_patch_management": "Are identified vulnerabilities corrected quickly (patch management process)?",
+    "D_firewall_ids": "Do you have firewalls and intrusion detection/prevention systems in place?",
+    "D_malware_protection": "Do you have malware protection for remote access, email, and mobile devices?",
+    "D_mfa": "Do you use multi-factor authentication (MFA) for critical systems?",
+    "D_endpoint_security": "Is endpoint protection deployed across the network?",
+    "E_ir_plan": "Do you have a formal incident response plan?",
+    "E_incidents_5y": "Have you experienced any cyber incidents in the last 5 years?",
+    "E_potential_claims": "Are you aware of any events that could lead to a cyber insurance claim?",
+    "H_supplier_access": "Do suppliers or third parties have access to your systems or sensitive data?",
+    "H_thirdparty_policy": "Do you have a security policy for third parties?",
+    "H_contract_clauses": "Do your contracts include cybersecurity clauses with suppliers?",
+    "H_update_policy": "Do you have a policy for keeping software up to date?",
+    "I_dashboards": "Do you use dashboards or KPIs to monitor cyber security?",
+    "J_external_audit": "Have you had an external security audit performed?",
+    "J_results_to_management": "Were the audit results shared with senior management?",
+    "K_risky_behaviour_policy": "Do you have a policy for managing risky user behaviour (e.g., clear rules on acceptable use)?",
+    "K_phishing_sims": "Do you conduct phishing simulations?",
+    "L_byod_policy": "Do you have a Bring Your Own Device (BYOD) policy?",
+    "L_personal_device_security": "Are personal devices required to use security controls (e.g., MDM, encryption, PIN/biometrics)?",
+}
+
+# Section column of the Yes / No table, by key prefix
+_YES_NO_SECTIONS = {
+    "C": "C. Organisation and Security Policies",
+    "D": "D. Infrastructure and IT Controls",
+    "E": "E. Incident Response and History",
+    "H": "H. Supplier and Third-Party Security",
+    "I": "I. Security Indicators and Monitoring",
+    "J": "J. Tests and Audits",
+    "K": "K. Awareness and Security Culture",
+    "L": "L. Mobile Devices and BYOD",
+}
+
+# st.data_editor row height and border (px), to show every Yes / No row without scrolling
+_EDITOR_ROW_PX = 35
+_EDITOR_BORDER_PX = 3
+
 
 # ---------------------------------------------------------
 # Scoring logic
 # ---------------------------------------------------------
 
-def calculate_section_scores(responses: dict) -> dict:
+def _section_means_numpy(items: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Mean item score of each averaged section (NumPy fallback)."""
+    return np.add.reduceat(items, starts) / lengths
+
+
+def _section_means_kernel(items, starts, lengths):
+    """Mean item score of each averaged section, as a loop numba can compile."""
+    means = np.empty(starts.shape[0])
+    for s in range(starts.shape[0]):
+        total = 0.0
+        for i in range(starts[s], starts[s] + lengths[s]):
+            total += items[i]
+        means[s] = total / lengths[s]
+    return means
+
+
+@st.cache_resource(show_spinner=False)
+def _compiled_section_means():
+    """Compile _section_means_kernel with numba once per server process."""
+    from numba import njit
+
+    kernel = njit(_section_means_kernel)
+    # Warm up with the real argument types, so the first submit does not pay the compile
+    kernel(np.zeros(len(_ITEM_KEYS), dtype=np.int16), _SECTION_STARTS, _SECTION_LENGTHS)
+    return kernel
+
+
+# Resolved once per run rather than per scoring call
+_section_means = _compiled_section_means() if NUMBA_AVAILABLE else _section_means_numpy
+
+
+def calculate_section_scores(responses: dict) -> tuple:
     """
     Given all questionnaire responses, compute a score per section B–L.
     Each section score is in [0, 100].
+    Returns (scores dict for display, scores vector in _SEC_ORDER order).
     """
     scores = {}
 
     # ----- Section B: Data and sensitive information -----
-    b_score = data_sensitivity_score(responses["B_types"])
-    scores["B"] = b_score
-
-    # ----- Section C: Organisation and security policies -----
-    c_items = []
-    c_items.append(yes_no_score(responses["C_infosec_policy"]))      # formal infosec policy
-    c_items.append(yes_no_score(responses["C_privacy_policy"]))      # up-to-date privacy policy
-    c_items.append(yes_no_score(responses["C_training"]))            # regular cyber training
-    c_items.append(yes_no_score(responses["C_encryption"]))          # electronic data encrypted
-    c_items.append(yes_no_score(responses["C_access_revocation"]))   # prompt access revocation
-    c_items.append(yes_no_score(responses["C_pentesting"]))          # periodic penetration/vuln tests
-    c_items.append(yes_no_score(responses["C_patch_management"]))    # quick remediation of vulnerabilities
-    scores["C"] = sum(c_items) / len(c_items)
-
-    # ----- Section D: Infrastructure & IT controls -----
-    d_items = []
-    d_items.append(yes_no_score(responses["D_firewall_ids"]))        # firewalls & IDS/IPS
-    d_items.append(yes_no_score(responses["D_malware_protection"]))  # malware protection
-    d_items.append(yes_no_score(responses["D_mfa"]))                 # multi-factor auth
-    d_items.append(yes_no_score(responses["D_endpoint_security"]))   # endpoint protection
-    d_items.append(backup_frequency_score(responses["D_backup_freq"]))  # backup frequency
-    scores["D"] = sum(d_items) / len(d_items)
-
-    # ----- Section E: Incident response & history -----
-    e_items = []
-    e_items.append(yes_no_score(responses["E_ir_plan"]))  # incident response plan
-    # Incidents in last 5 years (No is better)
-    e_items.append(yes_no_score(responses["E_incidents_5y"], yes_value=100, no_value=40))
-    # Events that could lead to a claim (No is better)
-    e_items.append(yes_no_score(responses["E_potential_claims"], yes_value=100, no_value=30))
-    scores["E"] = sum(e_items) / len(e_items)
+    scores["B"] = data_sensitivity_score(responses["B_types"])
+
+    # ----- Sections C, D, E, H, I, J, K, L: mean of item scores -----
+    answers = np.array([responses[key] for key in _ITEM_KEYS])
+    items = np.where(answers == "Yes", _ITEM_YES, _ITEM_NO)
+    for pos, key, scorer in _ORDINAL_ITEMS:
+        items[pos] = scorer(responses[key])
+    means = _section_means(items, _SECTION_STARTS, _SECTION_LENGTHS)
+    scores.update(zip(_AVERAGED_SECTIONS, means.tolist()))
 
     # ----- Section F: Activities & professional exposures -----
     scores["F"] = sector_inherent_risk_score(responses["F_sectors"])
@@ -159,50 +338,16 @@ def calculate_section_scores(responses: dict) -> dict:
     # ----- Section G: Coverage requested -----
     scores["G"] = coverage_awareness_score(responses["G_options"])
 
-    # ----- Section H: Supplier & third-party security -----
-    h_items = []
-    h_items.append(yes_no_score(responses["H_supplier_access"], yes_value=70, no_value=100))
-    h_items.append(yes_no_score(responses["H_thirdparty_policy"]))
-    h_items.append(yes_no_score(responses["H_contract_clauses"]))
-    h_items.append(yes_no_score(responses["H_update_policy"]))
-    scores["H"] = sum(h_items) / len(h_items)
-
-    # ----- Section I: Security indicators & monitoring -----
-    i_items = []
-    i_items.append(yes_no_score(responses["I_dashboards"]))
-    i_items.append(frequency_score(responses["I_reporting_freq"]))
-    scores["I"] = sum(i_items) / len(i_items)
-
-    # ----- Section J: Tests & audits -----
-    j_items = []
-    j_items.append(yes_no_score(responses["J_external_audit"]))
-    j_items.append(yes_no_score(responses["J_results_to_management"]))
-    scores["J"] = sum(j_items) / len(j_items)
-
-    # ----- Section K: Awareness & security culture -----
-    k_items = []
-    k_items.append(yes_no_score(responses["K_risky_behaviour_policy"]))
-    k_items.append(yes_no_score(responses["K_phishing_sims"]))
-    k_items.append(frequency_score(responses["K_phishing_freq"]))
-    scores["K"] = sum(k_items) / len(k_items)
-
-    # ----- Section L: Mobile devices & BYOD -----
-    l_items = []
-    l_items.append(yes_no_score(responses["L_byod_policy"]))
-    l_items.append(yes_no_score(responses["L_personal_device_security"]))
-    scores["L"] = sum(l_items) / len(l_items)
-
-    return scores
-
-
-def calculate_overall_score(section_scores: dict) -> float:
+    scores_vec = np.array([scores[sec] for sec in _SEC_ORDER])
+    return scores, scores_vec
+
+
+def calculate_overall_score(scores_vec: np.ndarray) -> float:
     """
     Weighted average of section scores according to SECTION_WEIGHTS.
+    Expects the scores vector returned by calculate_section_scores.
     """
-    total = 0.0
-    for sec, weight in SECTION_WEIGHTS.items():
-        total += section_scores.get(sec, 0) * weight
-    return total
+    return float(_WEIGHTS @ scores_vec)
 
 
 def risk_label(score: float) -> str:
@@ -218,42 +363,63 @@ def risk_label(score: float) -> str:
 
 
 # ---------------------------------------------------------
-# PDF generation helpers
+# Cached scoring (Streamlit reruns the whole script on every widget change)
 # ---------------------------------------------------------
 
-def _wrap_text(text: str, max_chars: int = 90):
-    """Simple word-wrap to avoid overflowing PDF lines."""
-    words = str(text).split()
-    lines = []
-    line = ""
-    for w in words:
-        if len(line) + len(w) + 1 <= max_chars:
-            line = f"{line} {w}".strip()
-        else:
-            lines.append(line)
-            line = w
-    if line:
-        lines.append(line)
-    return lines
+def _freeze_responses(responses: dict) -> tuple:
+    """
+    Convert the scoring answers (_SCORING_KEYS) of a responses dict into a hashable
+    tuple usable as a cache key; other keys, e.g. free-text A answers, are ignored.
+    List answers (multiselects) are converted to sorted tuples.
+    """
+    frozen = []
+    for key in _SCORING_KEYS:
+        value = responses[key]
+        frozen.append((key, tuple(sorted(value)) if isinstance(value, list) else value))
+    return tuple(frozen)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_section_scores(resp_tuple: tuple) -> tuple:
+    """Memoized calculate_section_scores, keyed on a frozen responses tuple."""
+    return calculate_section_scores(dict(resp_tuple))
+
 
+@st.cache_data(show_spinner=False)
+def _cached_overall(scores_vec: np.ndarray) -> float:
+    """Memoized calculate_overall_score, keyed on the section scores vector."""
+    return calculate_overall_score(scores_vec)
 
-def generate_pdf(all_answers: dict, section_scores: dict, overall: float, label: str) -> BytesIO:
+
+# ---------------------------------------------------------
+# PDF generation helpers
+# ---------------------------------------------------------
+
+def generate_pdf(
+    all_answers: dict, section_scores: dict, overall: float, label: str, timestamp: str
+) -> BytesIO:
     """
     Generate a PDF report with overall score, section scores and questionnaire answers.
+    `timestamp` is printed in the footer of every page.
     Returns a BytesIO buffer containing the PDF.
     """
     from reportlab.pdfgen import canvas  # safe: only called if REPORTLAB_AVAILABLE is True
     from reportlab.lib.pagesizes import A4
 
     buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
+    # zlib-compress page content streams; the questionnaire dump is mostly text operators
+    c = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
     width, height = A4
 
-    # Fixed timestamp for this report
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    # Body fonts (name, size, leading) for the section list and the questionnaire dump
+    scores_font = ("Helvetica", 10)
+    answers_font = ("Helvetica", 9, 12)
 
-    def draw_header_footer():
-        """Draw Cybastion/Riskare header and footer with date & confidentiality."""
+    def draw_header_footer(body_font=scores_font):
+        """
+        Draw Cybastion/Riskare header and footer with date & confidentiality,
+        then leave the canvas in `body_font` for the page content.
+        """
         # Header
         c.setFont("Helvetica-Bold", 14)
         c.drawString(40, height - 40, "Cybastion")
@@ -265,6 +431,8 @@ def generate_pdf(all_answers: dict, section_scores: dict, overall: float, label:
         c.drawString(40, footer_y, f"Generated on {timestamp}")
         c.drawRightString(width - 40, footer_y, "Confidential – for internal use only")
 
+        c.setFont(*body_font)
+
     # First page header/footer
     draw_header_footer()
 
@@ -283,16 +451,15 @@ def generate_pdf(all_answers: dict, section_scores: dict, overall: float, label:
     c.drawString(40, y, "Section Scores")
     y -= 18
 
-    c.setFont("Helvetica", 10)
+    c.setFont(*scores_font)
     for sec in sorted(section_scores.keys()):
         c.drawString(50, y, f"Section {sec}: {section_scores[sec]:.1f} / 100")
         y -= 14
 
         if y < 80:
             c.showPage()
-            draw_header_footer()
+            draw_header_footer(scores_font)
             y = height - 80
-            c.setFont("Helvetica", 10)
 
     # Questionnaire responses
     y -= 10
@@ -300,35 +467,242 @@ def generate_pdf(all_answers: dict, section_scores: dict, overall: float, label:
     c.drawString(40, y, "Questionnaire Responses")
     y -= 18
 
-    c.setFont("Helvetica", 9)
+    # One text object per page instead of one drawString per line;
+    # text objects pick up the canvas font and leading set just before
+    c.setFont(*answers_font)
+    text = c.beginText(50, y)
     for key, value in all_answers.items():
-        if isinstance(value, list):
+        if isinstance(value, (list, tuple)):
             display_value = ", ".join(value) if value else "None"
         else:
             display_value = value if value not in ("", None) else "None"
 
         text_line = f"{key}: {display_value}"
 
-        for line in _wrap_text(text_line, max_chars=95):
-            c.drawString(50, y, line)
+        wrapped = textwrap.wrap(text_line, width=95, break_long_words=False, break_on_hyphens=False)
+        for line in wrapped or [""]:
+            text.textLine(line)
             y -= 12
 
             if y < 60:
+                c.drawText(text)
                 c.showPage()
-                draw_header_footer()
+                draw_header_footer(answers_font)
                 y = height - 80
-                c.setFont("Helvetica", 9)
+                text = c.beginText(50, y)
 
+    c.drawText(text)
     c.showPage()
     c.save()
     buffer.seek(0)
     return buffer
 
 
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def _cached_pdf(
+    answers_tuple: tuple, scores_tuple: tuple, overall: float, label: str, timestamp: str
+) -> bytes:
+    """
+    Memoized generate_pdf, keyed on ordered (key, answer) pairs.
+    The minute-resolution timestamp is part of the key, so a cached report never
+    carries a stale footer date.
+    Returns raw PDF bytes, which are cheaper to cache than a BytesIO.
+    """
+    return generate_pdf(dict(answers_tuple), dict(scores_tuple), overall, label, timestamp).getvalue()
+
+
+# ---------------------------------------------------------
+# Static page markup (built once at import, re-sent unchanged on each rerun)
+# ---------------------------------------------------------
+
+_CSS_HTML = """
+<style>
+.block-container {
+    max-width: 960px;
+    padding-top: 2rem;
+    margin: 0 auto;
+}
+
+/* Big primary button */
+.stButton > button,
+.stFormSubmitButton > button {
+    background: linear-gradient(90deg, #1f77b4, #4dabf7);
+    color: white;
+    padding: 0.8rem 1.8rem;
+    border-radius: 999px;
+    border: none;
+    font-size: 1.1rem;
+    font-weight: 600;
+    box-shadow: 0 4px 12px rgba(31, 119, 180, 0.35);
+}
+.stButton > button:hover,
+.stFormSubmitButton > button:hover {
+    filter: brightness(1.05);
+    box-shadow: 0 6px 16px rgba(31, 119, 180, 0.45);
+}
+
+/* Score card */
+.score-card {
+    border-radius: 16px;
+    padding: 1.5rem 1.75rem;
+    margin-top: 1.5rem;
+    box-shadow: 0 12px 30px rgba(15, 23, 42, 0.12);
+    border-left: 6px solid transparent;
+}
+.score-card-title {
+    font-size: 0.95rem;
+    text-transform: uppercase;
+    letter-spacing: 0.08em;
+    opacity: 0.7;
+    margin-bottom: 0.25rem;
+}
+.score-card-value {
+    font-size: 2.4rem;
+    font-weight: 700;
+    line-height: 1.1;
+}
+.score-card-label {
+    margin-top: 0.5rem;
+    font-size: 1rem;
+}
+.score-subtext {
+    margin-top: 0.75rem;
+    font-size: 0.9rem;
+    opacity: 0.88;
+}
+.score-good {
+    background: #e6f4ea;
+    border-left-color: #1e8e3e;
+}
+.score-medium {
+    background: #fff8e1;
+    border-left-color: #fbbc04;
+}
+.score-low {
+    background: #fce8e6;
+    border-left-color: #d93025;
+}
+</style>
+"""
+
+_BRAND_LEFT_HTML = "<div style='margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Cybastion</div>"
+_BRAND_RIGHT_HTML = (
+    "<div style='text-align: right; margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Riskare</div>"
+)
+_TITLE_HTML = (
+    "<h1 style='text-align: center; margin-top: 0.4rem; margin-bottom: 0.6rem;'>Cyber Security Scoring App</h1>"
+)
+
+_ABOUT_HTML = """
+<div style="
+    margin: 0.5rem 0 1.5rem 0;
+    padding: 0.85rem 1.1rem;
+    border-radius: 12px;
+    background: #f5f5f7;
+    border: 1px solid #e5e7eb;
+    font-size: 0.95rem;
+">
+    <strong>About this assessment</strong><br/>
+    This cyber security scoring app provides an indicative view of your organisation's cyber security posture,
+    based on governance, technical controls, incident preparedness and user awareness.
+</div>
+"""
+
+
 # ---------------------------------------------------------
 # Streamlit UI
 # ---------------------------------------------------------
 
+@st.fragment
+def _result_fragment(section_scores: dict, overall: float, label: str, answers_tuple: tuple):
+    """
+    Render the result card and PDF export.
+    Runs as a fragment, so interacting with it does not re-run the questionnaire.
+    """
+    if overall >= 80:
+        score_class = "score-good"
+        subtext = "This indicates a strong cyber security posture with good controls in place."
+    elif overall >= 60:
+        score_class = "score-medium"
+        subtext = "Your cyber security posture is moderate. There are controls in place, but there is room for improvement."
+    else:
+        score_class = "score-low"
+        subtext = "Your organisation appears to have a weak cyber security posture and may be exposed to significant risks."
+
+    st.markdown("## Result")
+    st.progress(min(1.0, overall / 100.0))
+
+    st.markdown(
+        f"""
+        <div class="score-card {score_class}">
+            <div class="score-card-title">Overall Cyber Security Score</div>
+            <div class="score-card-value">{overall:.1f} / 100</div>
+            <div class="score-card-label"><strong>{label}</strong></div>
+            <div class="score-subtext">{subtext}</div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # ---------- SECTION 3: EXPORT PDF ----------
+    st.markdown(
+        """
+        <div style="margin-top: 2.5rem; border-top: 2px solid #e5e7eb; padding-top: 1rem;"></div>
+        """,
+        unsafe_allow_html=True,
+    )
+    st.markdown("## 3. Export PDF Report")
+
+    if not REPORTLAB_AVAILABLE:
+        st.warning(
+            "PDF export requires the `reportlab` package. "
+            "Please install it with `pip install reportlab` and rerun the app."
+        )
+    else:
+        timestamp = time.strftime("%Y-%m-%d %H:%M")
+        pdf_buffer = BytesIO(
+            _cached_pdf(answers_tuple, tuple(sorted(section_scores.items())), overall, label, timestamp)
+        )
+        st.download_button(
+            label="Download PDF report",
+            data=pdf_buffer,
+            file_name="cyber_security_assessment.pdf",
+            mime="application/pdf",
+            use_container_width=True,
+        )
+
+
+def _yes_no_table() -> dict:
+    """
+    Show every Yes/No question (C–L) as a row of one st.data_editor instead of a radio each.
+    Returns {key: "Yes" / "No"}; answers default to Yes, as the radios did.
+    """
+    table = st.data_editor(
+        pd.DataFrame(
+            {
+                "Section": [_YES_NO_SECTIONS[key[0]] for key in _YES_NO_QUESTIONS],
+                "Question": list(_YES_NO_QUESTIONS.values()),
+                "Answer": "Yes",
+            },
+            index=list(_YES_NO_QUESTIONS),
+        ),
+        column_config={
+            "Answer": st.column_config.SelectboxColumn(
+                "Answer",
+                options=["Yes", "No"],
+                required=True,
+            ),
+        },
+        disabled=["Section", "Question"],
+        hide_index=True,
+        use_container_width=True,
+        # One row per question plus the header row
+        height=(len(_YES_NO_QUESTIONS) + 1) * _EDITOR_ROW_PX + _EDITOR_BORDER_PX,
+        key="yes_no_table",
+    )
+    return dict(zip(table.index, table["Answer"]))
+
+
 def main():
     st.set_page_config(page_title="Cyber Security Scoring", layout="centered")
 
@@ -351,116 +725,22 @@ def main():
         st.stop()
 
     # ---------- Custom CSS ----------
-    st.markdown(
-        """
-        <style>
-        .block-container {
-            max-width: 960px;
-            padding-top: 2rem;
-            margin: 0 auto;
-        }
-
-        /* Big primary button */
-        .stButton > button {
-            background: linear-gradient(90deg, #1f77b4, #4dabf7);
-            color: white;
-            padding: 0.8rem 1.8rem;
-            border-radius: 999px;
-            border: none;
-            font-size: 1.1rem;
-            font-weight: 600;
-            box-shadow: 0 4px 12px rgba(31, 119, 180, 0.35);
-        }
-        .stButton > button:hover {
-            filter: brightness(1.05);
-            box-shadow: 0 6px 16px rgba(31, 119, 180, 0.45);
-        }
-
-        /* Score card */
-        .score-card {
-            border-radius: 16px;
-            padding: 1.5rem 1.75rem;
-            margin-top: 1.5rem;
-            box-shadow: 0 12px 30px rgba(15, 23, 42, 0.12);
-            border-left: 6px solid transparent;
-        }
-        .score-card-title {
-            font-size: 0.95rem;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            opacity: 0.7;
-            margin-bottom: 0.25rem;
-        }
-        .score-card-value {
-            font-size: 2.4rem;
-            font-weight: 700;
-            line-height: 1.1;
-        }
-        .score-card-label {
-            margin-top: 0.5rem;
-            font-size: 1rem;
-        }
-        .score-subtext {
-            margin-top: 0.75rem;
-            font-size: 0.9rem;
-            opacity: 0.88;
-        }
-        .score-good {
-            background: #e6f4ea;
-            border-left-color: #1e8e3e;
-        }
-        .score-medium {
-            background: #fff8e1;
-            border-left-color: #fbbc04;
-        }
-        .score-low {
-            background: #fce8e6;
-            border-left-color: #d93025;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_CSS_HTML, unsafe_allow_html=True)
 
     # ---------- HEADER WITH "LOGOS" AND TITLE ----------
     header_cols = st.columns([1, 2, 1])
 
     with header_cols[0]:
-        st.markdown(
-            "<div style='margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Cybastion</div>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_BRAND_LEFT_HTML, unsafe_allow_html=True)
 
     with header_cols[2]:
-        st.markdown(
-            "<div style='text-align: right; margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Riskare</div>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_BRAND_RIGHT_HTML, unsafe_allow_html=True)
 
     # Centered main title
-    st.markdown(
-        "<h1 style='text-align: center; margin-top: 0.4rem; margin-bottom: 0.6rem;'>Cyber Security Scoring App</h1>",
-        unsafe_allow_html=True,
-    )
+    st.markdown(_TITLE_HTML, unsafe_allow_html=True)
 
     # ---------- ABOUT THIS ASSESSMENT BOX ----------
-    st.markdown(
-        """
-        <div style="
-            margin: 0.5rem 0 1.5rem 0;
-            padding: 0.85rem 1.1rem;
-            border-radius: 12px;
-            background: #f5f5f7;
-            border: 1px solid #e5e7eb;
-            font-size: 0.95rem;
-        ">
-            <strong>About this assessment</strong><br/>
-            This cyber security scoring app provides an indicative view of your organisation's cyber security posture,
-            based on governance, technical controls, incident preparedness and user awareness.
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_ABOUT_HTML, unsafe_allow_html=True)
 
     st.write(
         """
@@ -471,424 +751,195 @@ def main():
     )
 
     # ---------- SECTION 1: QUESTIONNAIRE ----------
-    st.markdown("## 1. Questionnaire")
-
-    # A. General Information (not scored)
-    st.header("A. General Information")
-    a_company_name = st.text_input("Legal entity name")
-    a_address = st.text_input("Registered office address")
-    a_websites = st.text_input("Website(s) / Domain(s)")
-    a_activity = st.text_area("Description of activity")
-    a_employees = st.text_input("Number of employees")
-    a_revenue = st.text_input("Annual turnover (last financial year, currency)")
-    a_years = st.text_input("Years in operation")
-    a_contact = st.text_area(
-        "Primary cybersecurity contact (Name, Role, Email, Phone)"
-    )
-
-    # B. Data & sensitive information
-    st.header("B. Data and Sensitive Information")
-    b_types = st.multiselect(
-        "What types of sensitive information do you store or process? (select all that apply)",
-        options=[
-            "Payment cards / debit / Mobile Money information",
-            "Medical records",
-            "Financial accounts",
-            "Official ID documents or other identity information",
-            "Intellectual property",
-            "Other sensitive data",
-        ],
-    )
-
-    # C. Organisation and security policies
-    st.header("C. Organisation and Security Policies")
-    c_infosec_policy = st.radio(
-        "Do you have a formal information security policy?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    c_privacy_policy = st.radio(
-        "Do you have an up-to-date privacy policy?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    c_training = st.radio(
-        "Do employees receive regular cybersecurity awareness training?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    c_encryption = st.radio(
-        "Are electronic data encrypted (at rest and/or in transit)?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    c_encryption_details = st.text_input(
-        "If yes, specify media/systems where encryption is used"
-    )
-    c_access_revocation = st.radio(
-        "Are user access rights removed promptly when staff leave or change roles?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    c_pentesting = st.radio(
-        "Do you perform periodic penetration tests or vulnerability assessments?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    c_patch_management = st.radio(
-        "Are identified vulnerabilities corrected quickly (patch management process)?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-
-    # D. Infrastructure and IT controls
-    st.header("D. Infrastructure and IT Controls")
-    d_firewall_ids = st.radio(
-        "Do you have firewalls and intrusion detection/prevention systems in place?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    d_malware_protection = st.radio(
-        "Do you have malware protection for remote access, email, and mobile devices?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    d_mfa = st.radio(
-        "Do you use multi-factor authentication (MFA) for critical systems?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    d_endpoint_security = st.radio(
-        "Is endpoint protection deployed across the network?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    d_backup_freq = st.selectbox(
-        "What is the frequency of your data backups?",
-        options=[
-            "No regular backups",
-            "Monthly",
-            "Weekly",
-            "Daily or more often",
-        ],
-    )
-    d_backup_location = st.text_input(
-        "Where are backups stored? (on-site / off-site / cloud, etc.)"
-    )
-
-    # E. Incident response and history
-    st.header("E. Incident Response and History")
-    e_ir_plan = st.radio(
-        "Do you have a formal incident response plan?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    e_incidents_5y = st.radio(
-        "Have you experienced any cyber incidents in the last 5 years?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    e_incident_details = st.text_area(
-        "If yes, briefly describe the incidents"
-    )
-    e_potential_claims = st.radio(
-        "Are you aware of any events that could lead to a cyber insurance claim?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    e_claim_details = st.text_area(
-        "If yes, briefly describe these events"
-    )
-
-    # F. Activities and professional exposures
-    st.header("F. Activities and Professional Exposures")
-    f_sectors = st.multiselect(
-        "Which of the following sectors best describe your organisation? (select all that apply)",
-        options=[
-            "Water and Energy (electricity, gas, oil, water)",
-            "Financial institution (bank, insurance, microfinance, collection, etc.)",
-            "Sports betting / gambling",
-            "Telecommunications / new technologies",
-            "Healthcare / medical / provident fund",
-            "Commerce / agro-industry",
-            "Other",
-        ],
-    )
-    f_other = st.text_input("If 'Other', please specify")
-
-    # G. Requested coverage details
-    st.header("G. Requested Coverage Details")
-    g_amount = st.text_input(
-        "Desired insured amount and deductible (not directly scored)"
-    )
-    g_options = st.multiselect(
-        "Which coverage options are you interested in? (select all that apply)",
-        options=[
-            "Business interruption",
-            "Data restoration",
-            "Ransomware / cyber extortion",
-            "Social engineering fraud",
-            "Regulatory fines",
-            "Reputational harm",
-            "Media liability",
-        ],
-    )
+    # Batch all answers in one form so the app only reruns on submit
+    answers = {}
+    with st.form("assessment", clear_on_submit=False):
+        st.markdown("## 1. Questionnaire")
+
+        # A. General Information (not scored)
+        st.header("A. General Information")
+        answers["A_company_name"] = st.text_input("Legal entity name")
+        answers["A_address"] = st.text_input("Registered office address")
+        answers["A_websites"] = st.text_input("Website(s) / Domain(s)")
+        answers["A_activity"] = st.text_area("Description of activity")
+        answers["A_employees"] = st.text_input("Number of employees")
+        answers["A_revenue"] = st.text_input("Annual turnover (last financial year, currency)")
+        answers["A_years"] = st.text_input("Years in operation")
+        answers["A_primary_contact"] = st.text_area(
+            "Primary cybersecurity contact (Name, Role, Email, Phone)"
+        )
 
-    # H. Supplier and third-party security
-    st.header("H. Supplier and Third-Party Security")
-    h_supplier_access = st.radio(
-        "Do suppliers or third parties have access to your systems or sensitive data?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    h_thirdparty_policy = st.radio(
-        "Do you have a security policy for third parties?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    h_contract_clauses = st.radio(
-        "Do your contracts include cybersecurity clauses with suppliers?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    h_update_policy = st.radio(
-        "Do you have a policy for keeping software up to date?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    h_software_list = st.text_area(
-        "List key software used in your organisation"
-    )
+        # B. Data & sensitive information
+        st.header("B. Data and Sensitive Information")
+        answers["B_types"] = st.multiselect(
+            "What types of sensitive information do you store or process? (select all that apply)",
+            options=[
+                "Payment cards / debit / Mobile Money information",
+                "Medical records",
+                "Financial accounts",
+                "Official ID documents or other identity information",
+                "Intellectual property",
+                "Other sensitive data",
+            ],
+        )
 
-    # I. Security indicators and monitoring
-    st.header("I. Security Indicators and Monitoring")
-    i_dashboards = st.radio(
-        "Do you use dashboards or KPIs to monitor cyber security?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    i_reporting_freq = st.selectbox(
-        "How often are security reports provided to management?",
-        options=[
-            "Ad hoc / not defined",
-            "Annually",
-            "Quarterly",
-            "Monthly",
-            "Weekly or more often",
-        ],
-    )
+        # C–L. All Yes / No controls in a single table (one widget instead of 25 radios)
+        st.header("Security Controls (C–L)")
+        st.write("Set each answer to Yes or No, then fill in the details below.")
+        answers.update(_yes_no_table())
 
-    # J. Tests and audits
-    st.header("J. Tests and Audits")
-    j_external_audit = st.radio(
-        "Have you had an external security audit performed?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    j_last_audit_date = st.text_input(
-        "If yes, date of the last audit"
-    )
-    j_results_to_management = st.radio(
-        "Were the audit results shared with senior management?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
+        # C. Organisation and security policies
+        st.header("C. Organisation and Security Policies")
+        st.caption(f"Follow-up to: {_YES_NO_QUESTIONS['C_encryption']}")
+        answers["C_encryption_details"] = st.text_input(
+            "If yes, specify media/systems where encryption is used"
+        )
 
-    # K. Awareness and security culture
-    st.header("K. Awareness and Security Culture")
-    k_risky_behaviour_policy = st.radio(
-        "Do you have a policy for managing risky user behaviour (e.g., clear rules on acceptable use)?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    k_phishing_sims = st.radio(
-        "Do you conduct phishing simulations?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    k_phishing_freq = st.selectbox(
-        "If yes, how often are phishing simulations carried out?",
-        options=[
-            "Ad hoc / not defined",
-            "Annually",
-            "Quarterly",
-            "Monthly",
-            "Weekly or more often",
-        ],
-    )
+        # D. Infrastructure and IT controls
+        st.header("D. Infrastructure and IT Controls")
+        answers["D_backup_freq"] = st.selectbox(
+            "What is the frequency of your data backups?",
+            options=[
+                "No regular backups",
+                "Monthly",
+                "Weekly",
+                "Daily or more often",
+            ],
+        )
+        answers["D_backup_location"] = st.text_input(
+            "Where are backups stored? (on-site / off-site / cloud, etc.)"
+        )
 
-    # L. Mobile devices and BYOD
-    st.header("L. Mobile Devices and BYOD")
-    l_byod_policy = st.radio(
-        "Do you have a Bring Your Own Device (BYOD) policy?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
-    l_personal_device_security = st.radio(
-        "Are personal devices required to use security controls (e.g., MDM, encryption, PIN/biometrics)?",
-        options=["Yes", "No"],
-        horizontal=True,
-    )
+        # E. Incident response and history
+        st.header("E. Incident Response and History")
+        st.caption(f"Follow-up to: {_YES_NO_QUESTIONS['E_incidents_5y']}")
+        answers["E_incident_details"] = st.text_area(
+            "If yes, briefly describe the incidents"
+        )
+        st.caption(f"Follow-up to: {_YES_NO_QUESTIONS['E_potential_claims']}")
+        answers["E_claim_details"] = st.text_area(
+            "If yes, briefly describe these events"
+        )
 
-    # ---------- Separator before Section 2 ----------
-    st.markdown(
-        """
-        <div style="margin-top: 3rem; border-top: 3px solid #e5e7eb; padding-top: 1.5rem;"></div>
-        """,
-        unsafe_allow_html=True,
-    )
+        # F. Activities and professional exposures
+        st.header("F. Activities and Professional Exposures")
+        answers["F_sectors"] = st.multiselect(
+            "Which of the following sectors best describe your organisation? (select all that apply)",
+            options=[
+                "Water and Energy (electricity, gas, oil, water)",
+                "Financial institution (bank, insurance, microfinance, collection, etc.)",
+                "Sports betting / gambling",
+                "Telecommunications / new technologies",
+                "Healthcare / medical / provident fund",
+                "Commerce / agro-industry",
+                "Other",
+            ],
+        )
+        answers["F_other"] = st.text_input("If 'Other', please specify")
 
-    # ---------- SECTION 2: SCORE CALCULATION ----------
-    st.markdown("## 2. Score Calculation")
-    st.write("Click the button below to calculate your cyber security score based on the answers above.")
+        # G. Requested coverage details
+        st.header("G. Requested Coverage Details")
+        answers["G_amount"] = st.text_input(
+            "Desired insured amount and deductible (not directly scored)"
+        )
+        answers["G_options"] = st.multiselect(
+            "Which coverage options are you interested in? (select all that apply)",
+            options=[
+                "Business interruption",
+                "Data restoration",
+                "Ransomware / cyber extortion",
+                "Social engineering fraud",
+                "Regulatory fines",
+                "Reputational harm",
+                "Media liability",
+            ],
+        )
 
-    btn_col1, btn_col2, btn_col3 = st.columns([1, 2, 1])
-    with btn_col2:
-        submitted = st.button(
-            "Calculate Cyber Security Score",
-            use_container_width=True,
+        # H. Supplier and third-party security
+        st.header("H. Supplier and Third-Party Security")
+        answers["H_software_list"] = st.text_area(
+            "List key software used in your organisation"
         )
 
-    if submitted:
-        # responses used for scoring (B–L)
-        responses_for_scoring = {
-            "B_types": b_types,
-            "C_infosec_policy": c_infosec_policy,
-            "C_privacy_policy": c_privacy_policy,
-            "C_training": c_training,
-            "C_encryption": c_encryption,
-            "C_access_revocation": c_access_revocation,
-            "C_pentesting": c_pentesting,
-            "C_patch_management": c_patch_management,
-            "D_firewall_ids": d_firewall_ids,
-            "D_malware_protection": d_malware_protection,
-            "D_mfa": d_mfa,
-            "D_endpoint_security": d_endpoint_security,
-            "D_backup_freq": d_backup_freq,
-            "E_ir_plan": e_ir_plan,
-            "E_incidents_5y": e_incidents_5y,
-            "E_potential_claims": e_potential_claims,
-            "F_sectors": f_sectors,
-            "G_options": g_options,
-            "H_supplier_access": h_supplier_access,
-            "H_thirdparty_policy": h_thirdparty_policy,
-            "H_contract_clauses": h_contract_clauses,
-            "H_update_policy": h_update_policy,
-            "I_dashboards": i_dashboards,
-            "I_reporting_freq": i_reporting_freq,
-            "J_external_audit": j_external_audit,
-            "J_results_to_management": j_results_to_management,
-            "K_risky_behaviour_policy": k_risky_behaviour_policy,
-            "K_phishing_sims": k_phishing_sims,
-            "K_phishing_freq": k_phishing_freq,
-            "L_byod_policy": l_byod_policy,
-            "L_personal_device_security": l_personal_device_security,
-        }
-
-        # all answers (A–L) for the PDF
-        all_answers = {
-            "A_company_name": a_company_name,
-            "A_address": a_address,
-            "A_websites": a_websites,
-            "A_activity": a_activity,
-            "A_employees": a_employees,
-            "A_revenue": a_revenue,
-            "A_years": a_years,
-            "A_primary_contact": a_contact,
-            "B_types": b_types,
-            "C_infosec_policy": c_infosec_policy,
-            "C_privacy_policy": c_privacy_policy,
-            "C_training": c_training,
-            "C_encryption": c_encryption,
-            "C_encryption_details": c_encryption_details,
-            "C_access_revocation": c_access_revocation,
-            "C_pentesting": c_pentesting,
-            "C_patch_management": c_patch_management,
-            "D_firewall_ids": d_firewall_ids,
-            "D_malware_protection": d_malware_protection,
-            "D_mfa": d_mfa,
-            "D_endpoint_security": d_endpoint_security,
-            "D_backup_freq": d_backup_freq,
-            "D_backup_location": d_backup_location,
-            "E_ir_plan": e_ir_plan,
-            "E_incidents_5y": e_incidents_5y,
-            "E_incident_details": e_incident_details,
-            "E_potential_claims": e_potential_claims,
-            "E_claim_details": e_claim_details,
-            "F_sectors": f_sectors,
-            "F_other": f_other,
-            "G_amount": g_amount,
-            "G_options": g_options,
-            "H_supplier_access": h_supplier_access,
-            "H_thirdparty_policy": h_thirdparty_policy,
-            "H_contract_clauses": h_contract_clauses,
-            "H_update_policy": h_update_policy,
-            "H_software_list": h_software_list,
-            "I_dashboards": i_dashboards,
-            "I_reporting_freq": i_reporting_freq,
-            "J_external_audit": j_external_audit,
-            "J_last_audit_date": j_last_audit_date,
-            "J_results_to_management": j_results_to_management,
-            "K_risky_behaviour_policy": k_risky_behaviour_policy,
-            "K_phishing_sims": k_phishing_sims,
-            "K_phishing_freq": k_phishing_freq,
-            "L_byod_policy": l_byod_policy,
-            "L_personal_device_security": l_personal_device_security,
-        }
-
-        section_scores = calculate_section_scores(responses_for_scoring)
-        overall = calculate_overall_score(section_scores)
-        label = risk_label(overall)
-
-        if overall >= 80:
-            score_class = "score-good"
-            subtext = "This indicates a strong cyber security posture with good controls in place."
-        elif overall >= 60:
-            score_class = "score-medium"
-            subtext = "Your cyber security posture is moderate. There are controls in place, but there is room for improvement."
-        else:
-            score_class = "score-low"
-            subtext = "Your organisation appears to have a weak cyber security posture and may be exposed to significant risks."
+        # I. Security indicators and monitoring
+        st.header("I. Security Indicators and Monitoring")
+        answers["I_reporting_freq"] = st.selectbox(
+            "How often are security reports provided to management?",
+            options=[
+                "Ad hoc / not defined",
+                "Annually",
+                "Quarterly",
+                "Monthly",
+                "Weekly or more often",
+            ],
+        )
 
-        st.markdown("## Result")
-        st.progress(min(1.0, overall / 100.0))
+        # J. Tests and audits
+        st.header("J. Tests and Audits")
+        st.caption(f"Follow-up to: {_YES_NO_QUESTIONS['J_external_audit']}")
+        answers["J_last_audit_date"] = st.text_input(
+            "If yes, date of the last audit"
+        )
 
-        st.markdown(
-            f"""
-            <div class="score-card {score_class}">
-                <div class="score-card-title">Overall Cyber Security Score</div>
-                <div class="score-card-value">{overall:.1f} / 100</div>
-                <div class="score-card-label"><strong>{label}</strong></div>
-                <div class="score-subtext">{subtext}</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+        # K. Awareness and security culture
+        st.header("K. Awareness and Security Culture")
+        st.caption(f"Follow-up to: {_YES_NO_QUESTIONS['K_phishing_sims']}")
+        answers["K_phishing_freq"] = st.selectbox(
+            "If yes, how often are phishing simulations carried out?",
+            options=[
+                "Ad hoc / not defined",
+                "Annually",
+                "Quarterly",
+                "Monthly",
+                "Weekly or more often",
+            ],
         )
 
-        # ---------- SECTION 3: EXPORT PDF ----------
+        # ---------- Separator before Section 2 ----------
         st.markdown(
             """
-            <div style="margin-top: 2.5rem; border-top: 2px solid #e5e7eb; padding-top: 1rem;"></div>
+            <div style="margin-top: 3rem; border-top: 3px solid #e5e7eb; padding-top: 1.5rem;"></div>
             """,
             unsafe_allow_html=True,
         )
-        st.markdown("## 3. Export PDF Report")
 
-        if not REPORTLAB_AVAILABLE:
-            st.warning(
-                "PDF export requires the `reportlab` package. "
-                "Please install it with `pip install reportlab` and rerun the app."
-            )
-        else:
-            pdf_buffer = generate_pdf(all_answers, section_scores, overall, label)
-            st.download_button(
-                label="Download PDF report",
-                data=pdf_buffer,
-                file_name="cyber_security_assessment.pdf",
-                mime="application/pdf",
+        # ---------- SECTION 2: SCORE CALCULATION ----------
+        st.markdown("## 2. Score Calculation")
+        st.write("Click the button below to calculate your cyber security score based on the answers above.")
+
+        btn_col1, btn_col2, btn_col3 = st.columns([1, 2, 1])
+        with btn_col2:
+            submitted = st.form_submit_button(
+                "Calculate Cyber Security Score",
                 use_container_width=True,
             )
 
+    if submitted:
+        # all answers (A–L) in PDF order; scoring only reads the B–L keys it needs
+        all_answers = {key: answers[key] for key in _ALL_KEYS}
+
+        # Hashable, ordered snapshot of the answers (multiselect lists become tuples)
+        answers_tuple = tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in all_answers.items()
+        )
+
+        if st.session_state.get("last_answers") == answers_tuple:
+            # Unchanged answers since the last submit in this session: reuse its result
+            section_scores, overall, label = st.session_state["last_result"]
+        else:
+            section_scores, scores_vec = _cached_section_scores(_freeze_responses(all_answers))
+            overall = _cached_overall(scores_vec)
+            label = risk_label(overall)
+            st.session_state["last_answers"] = answers_tuple
+            st.session_state["last_result"] = (section_scores, overall, label)
+
+        # Persist the result so the fragment below survives later reruns
+        st.session_state["assessment_result"] = (section_scores, overall, label, answers_tuple)
+
+    if "assessment_result" in st.session_state:
+        _result_fragment(*st.session_state["assessment_result"])
+
 
 if __name__ == "__main__":
     main()
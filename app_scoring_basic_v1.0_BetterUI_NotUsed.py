@@ -1,31 +1,75 @@
 import streamlit as st
+from bisect import bisect_right
 from io import BytesIO
+from string import Template
+from types import MappingProxyType
 from datetime import datetime
+from functools import lru_cache
+import hmac
+import importlib.util
 import math
+import textwrap
 
-# Try to import reportlab for PDF generation
-try:
+import numpy as np
+
+# Check for reportlab and plotly without importing them; both are slow to load,
+# so they are only imported (once) when a chart or PDF is actually built
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+
+
+@lru_cache(maxsize=None)
+def _plotly():
+    """Import and return plotly.graph_objects on first use."""
+    import plotly.graph_objects as go
+    return go
+
+
+@lru_cache(maxsize=None)
+def _reportlab():
+    """Import and return reportlab's (canvas module, A4 page size) on first use."""
     from reportlab.pdfgen import canvas
     from reportlab.lib.pagesizes import A4
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+    return canvas, A4
 
-# Try to import plotly for radar charts
-try:
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# numba is optional; when present it is imported only to compile the scoring kernel
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
 
 # ---------------------------------------------------------
 # Helper functions for scoring
 # ---------------------------------------------------------
 
-def yes_no_score(answer: str, yes_value: int = 100, no_value: int = 0) -> float:
-    """Map a Yes/No answer to a numeric score."""
-    return yes_value if answer == "Yes" else no_value
+# Reporting / simulation frequency -> maturity score (higher frequency => higher score)
+FREQUENCY_SCORES = {
+    "Ad hoc / not defined": 20,
+    "Annually": 40,
+    "Quarterly": 70,
+    "Monthly": 90,
+    "Weekly or more often": 100,
+}
+
+# Backup frequency -> score
+BACKUP_FREQUENCY_SCORES = {
+    "No regular backups": 0,
+    "Monthly": 40,
+    "Weekly": 70,
+    "Daily or more often": 100,
+}
+
+# Risk factor per sector (1 = very high risk), indexed through SECTOR_INDEX
+SECTOR_NAMES = (
+    "Water and Energy (electricity, gas, oil, water)",
+    "Financial institution (bank, insurance, microfinance, collection, etc.)",
+    "Sports betting / gambling",
+    "Telecommunications / new technologies",
+    "Healthcare / medical / provident fund",
+    "Commerce / agro-industry",
+    "Other",
+)
+SECTOR_FACTORS = np.array([0.9, 0.9, 0.8, 0.85, 0.9, 0.7, 0.6], dtype=np.float64)
+SECTOR_INDEX = {name: i for i, name in enumerate(SECTOR_NAMES)}
+_OTHER_SECTOR = SECTOR_INDEX["Other"]
 
 
 def frequency_score(freq: str) -> float:
@@ -33,51 +77,30 @@ def frequency_score(freq: str) -> float:
     Map reporting / simulation frequency to a maturity score.
     Higher frequency => higher score.
     """
-    mapping = {
-        "Ad hoc / not defined": 20,
-        "Annually": 40,
-        "Quarterly": 70,
-        "Monthly": 90,
-        "Weekly or more often": 100,
-    }
-    return mapping.get(freq, 0)
+    return FREQUENCY_SCORES.get(freq, 0)
 
 
 def backup_frequency_score(freq: str) -> float:
     """Score backup frequency."""
-    mapping = {
-        "No regular backups": 0,
-        "Monthly": 40,
-        "Weekly": 70,
-        "Daily or more often": 100,
-    }
-    return mapping.get(freq, 0)
+    return BACKUP_FREQUENCY_SCORES.get(freq, 0)
 
 
 def sector_inherent_risk_score(sectors) -> float:
     """
     Compute an inherent risk score based on sectors of activity.
     Higher inherent risk -> lower score.
-    We convert risk_factor in [0,1] to score = (1 - risk_factor)*100.
+    We convert the mean risk_factor in [0,1] to score = (1 - risk_factor)*100.
     """
     if not sectors:
         # No sensitive sector selected -> assume low inherent risk
         return 100.0
 
-    # Risk factor per sector (1 = very high risk)
-    risk_map = {
-        "Water and Energy (electricity, gas, oil, water)": 0.9,
-        "Financial institution (bank, insurance, microfinance, collection, etc.)": 0.9,
-        "Sports betting / gambling": 0.8,
-        "Telecommunications / new technologies": 0.85,
-        "Healthcare / medical / provident fund": 0.9,
-        "Commerce / agro-industry": 0.7,
-        "Other": 0.6,
-    }
-
-    factors = [risk_map.get(s, 0.6) for s in sectors]
-    avg_factor = sum(factors) / len(factors)
-    return max(0, (1 - avg_factor) * 100)
+    idxs = np.fromiter(
+        (SECTOR_INDEX.get(s, _OTHER_SECTOR) for s in sectors), dtype=np.int64, count=len(sectors)
+    )
+    # Every factor is <= 0.9, so the score cannot go negative
+    avg_factor = SECTOR_FACTORS[idxs].mean()
+    return float((1 - avg_factor) * 100)
 
 
 def data_sensitivity_score(selected_types) -> float:
@@ -87,8 +110,8 @@ def data_sensitivity_score(selected_types) -> float:
     """
     max_types = 6  # number of options
     n = len(selected_types)
-    exposure = min(1.0, n / max_types)
-    return max(0, (1 - exposure) * 100)
+    exposure = min(1.0, n / max_types)  # <= 1, so the score stays >= 0
+    return (1 - exposure) * 100
 
 
 def coverage_awareness_score(options) -> float:
@@ -98,11 +121,11 @@ def coverage_awareness_score(options) -> float:
     """
     max_opts = 7  # number of options
     n = len(options)
-    return (n / max_opts) * 100 if max_opts > 0 else 0
+    return (n / max_opts) * 100
 
 
 # UPDATED SECTION WEIGHTS - More meaningful distribution
-SECTION_WEIGHTS = {
+_SECTION_WEIGHTS_RAW = {
     "B": 0.08,  # Data & sensitive information (reduced - this is about exposure, not control)
     "C": 0.25,  # Organisation & security policies (INCREASED - foundational)
     "D": 0.20,  # Infrastructure & IT controls (INCREASED - critical technical controls)
@@ -116,53 +139,262 @@ SECTION_WEIGHTS = {
     "L": 0.02,  # Mobile devices & BYOD (maintained - specific but important)
 }
 
-# Verify weights sum to 1.0
-assert abs(sum(SECTION_WEIGHTS.values()) - 1.0) < 0.001, "Weights must sum to 1.0"
+# Verify weights sum to 1.0 (summed once, at import)
+SECTION_WEIGHT_SUM = sum(_SECTION_WEIGHTS_RAW.values())
+assert abs(SECTION_WEIGHT_SUM - 1.0) < 0.001, "Weights must sum to 1.0"
+
+# Read-only view, so the weights cannot be changed at runtime behind the caches' back
+SECTION_WEIGHTS = MappingProxyType(_SECTION_WEIGHTS_RAW)
+
+# Section order and matching weight vector, computed once at import
+SECTION_ORDER = tuple(SECTION_WEIGHTS)
+WEIGHTS_VEC = np.array([SECTION_WEIGHTS[sec] for sec in SECTION_ORDER])
+
+# Weight of each section as a percentage, for display
+SECTION_WEIGHT_PCT = MappingProxyType({sec: weight * 100 for sec, weight in SECTION_WEIGHTS.items()})
+
+# Sections ordered by weight (heaviest first)
+SORTED_SECTIONS_BY_WEIGHT = tuple(sorted(SECTION_WEIGHTS, key=SECTION_WEIGHTS.get, reverse=True))
+
+# Weights and weight percentages in SORTED_SECTIONS_BY_WEIGHT order, for the detailed results
+SORTED_WEIGHTS_VEC = np.array([SECTION_WEIGHTS[sec] for sec in SORTED_SECTIONS_BY_WEIGHT])
+SORTED_WEIGHT_PCT_VEC = SORTED_WEIGHTS_VEC * 100
+
+# Short section names used in charts and the PDF report (read-only)
+SECTION_NAMES = MappingProxyType({
+    "B": "Data & Sensitive Info",
+    "C": "Policies & Governance",
+    "D": "Infrastructure & IT",
+    "E": "Incident Response",
+    "F": "Sector Risk Profile",
+    "G": "Coverage Awareness",
+    "H": "Third-Party Security",
+    "I": "Monitoring & KPIs",
+    "J": "Tests & Audits",
+    "K": "Security Culture",
+    "L": "Mobile & BYOD"
+})
+
+# Longer section names used in the detailed results and key insights (read-only)
+SECTION_TITLES = MappingProxyType({
+    "B": "Data & Sensitive Information",
+    "C": "Policies & Governance",
+    "D": "Infrastructure & IT Controls",
+    "E": "Incident Response",
+    "F": "Sector Risk Profile",
+    "G": "Coverage Awareness",
+    "H": "Third-Party Security",
+    "I": "Monitoring & KPIs",
+    "J": "Tests & Audits",
+    "K": "Security Culture",
+    "L": "Mobile & BYOD"
+})
+
+# Items of the sections scored as a plain mean, in section order:
+# (section, response key, score if "Yes", score if "No").
+# Ordinal items (frequency selectboxes) are scored via _ORDINAL_SCORERS instead.
+_ITEM_SCHEMA = (
+    # Section C: Organisation and security policies
+    ("C", "C_infosec_policy", 100, 0),           # formal infosec policy
+    ("C", "C_privacy_policy", 100, 0),           # up-to-date privacy policy
+    ("C", "C_training", 100, 0),                 # regular cyber training
+    ("C", "C_encryption", 100, 0),               # electronic data encrypted
+    ("C", "C_access_revocation", 100, 0),        # prompt access revocation
+    ("C", "C_pentesting", 100, 0),               # periodic penetration/vuln tests
+    ("C", "C_patch_management", 100, 0),         # quick remediation of vulnerabilities
+    # Section D: Infrastructure & IT controls
+    ("D", "D_firewall_ids", 100, 0),             # firewalls & IDS/IPS
+    ("D", "D_malware_protection", 100, 0),       # malware protection
+    ("D", "D_mfa", 100, 0),                      # multi-factor auth
+    ("D", "D_endpoint_security", 100, 0),        # endpoint protection
+    ("D", "D_backup_freq", 0, 0),                # backup frequency (ordinal)
+    # Section E: Incident response & history
+    ("E", "E_ir_plan", 100, 0),                  # incident response plan
+    ("E", "E_incidents_5y", 40, 100),            # incidents in last 5 years (No is better)
+    ("E", "E_potential_claims", 30, 100),        # events that could lead to a claim (No is better)
+    # Section H: Supplier & third-party security
+    ("H", "H_supplier_access", 70, 100),
+    ("H", "H_thirdparty_policy", 100, 0),
+    ("H", "H_contract_clauses", 100, 0),
+    ("H", "H_update_policy", 100, 0),
+    # Section I: Security indicators & monitoring
+    ("I", "I_dashboards", 100, 0),
+    ("I", "I_reporting_freq", 0, 0),             # reporting frequency (ordinal)
+    # Section J: Tests & audits
+    ("J", "J_external_audit", 100, 0),
+    ("J", "J_results_to_management", 100, 0),
+    # Section K: Awareness & security culture
+    ("K", "K_risky_behaviour_policy", 100, 0),
+    ("K", "K_phishing_sims", 100, 0),
+    ("K", "K_phishing_freq", 0, 0),              # phishing simulation frequency (ordinal)
+    # Section L: Mobile devices & BYOD
+    ("L", "L_byod_policy", 100, 0),
+    ("L", "L_personal_device_security", 100, 0),
+)
+
+_ORDINAL_SCORERS = {
+    "D_backup_freq": backup_frequency_score,
+    "I_reporting_freq": frequency_score,
+    "K_phishing_freq": frequency_score,
+}
+
+# Precomputed arrays so each submit is a handful of NumPy operations
+_ITEM_KEYS = tuple(item[1] for item in _ITEM_SCHEMA)
+_ITEM_YES = np.array([item[2] for item in _ITEM_SCHEMA], dtype=np.int16)
+_ITEM_NO = np.array([item[3] for item in _ITEM_SCHEMA], dtype=np.int16)
+_ORDINAL_ITEMS = tuple(
+    (_ITEM_KEYS.index(key), key, scorer) for key, scorer in _ORDINAL_SCORERS.items()
+)
+
+_AVERAGED_SECTIONS = "CDEHIJKL"
+_item_sections = [item[0] for item in _ITEM_SCHEMA]
+_SECTION_STARTS = np.array([_item_sections.index(sec) for sec in _AVERAGED_SECTIONS])
+_SECTION_LENGTHS = np.array([_item_sections.count(sec) for sec in _AVERAGED_SECTIONS])
+
+# Answers that feed the score (B–L): (widget key in session_state, default)
+SCORING_KEYS = (
+    ("B_types", []),
+    ("C_infosec_policy", "No"),
+    ("C_privacy_policy", "No"),
+    ("C_training", "No"),
+    ("C_encryption", "No"),
+    ("C_access_revocation", "No"),
+    ("C_pentesting", "No"),
+    ("C_patch_management", "No"),
+    ("D_firewall_ids", "No"),
+    ("D_malware_protection", "No"),
+    ("D_mfa", "No"),
+    ("D_endpoint_security", "No"),
+    ("D_backup_freq", "No regular backups"),
+    ("E_ir_plan", "No"),
+    ("E_incidents_5y", "No"),
+    ("E_potential_claims", "No"),
+    ("F_sectors", []),
+    ("G_options", []),
+    ("H_supplier_access", "No"),
+    ("H_thirdparty_policy", "No"),
+    ("H_contract_clauses", "No"),
+    ("H_update_policy", "No"),
+    ("I_dashboards", "No"),
+    ("I_reporting_freq", "Ad hoc / not defined"),
+    ("J_external_audit", "No"),
+    ("J_results_to_management", "No"),
+    ("K_risky_behaviour_policy", "No"),
+    ("K_phishing_sims", "No"),
+    ("K_phishing_freq", "Ad hoc / not defined"),
+    ("L_byod_policy", "No"),
+    ("L_personal_device_security", "No"),
+)
+
+# Every questionnaire answer (A–L) for the PDF, in report order: (widget key, default)
+ANSWER_KEYS = (
+    ("A_company_name", ""),
+    ("A_address", ""),
+    ("A_websites", ""),
+    ("A_activity", ""),
+    ("A_employees", ""),
+    ("A_revenue", ""),
+    ("A_years", ""),
+    ("A_primary_contact", ""),
+    ("B_types", []),
+    ("C_infosec_policy", ""),
+    ("C_privacy_policy", ""),
+    ("C_training", ""),
+    ("C_encryption", ""),
+    ("C_encryption_details", ""),
+    ("C_access_revocation", ""),
+    ("C_pentesting", ""),
+    ("C_patch_management", ""),
+    ("D_firewall_ids", ""),
+    ("D_malware_protection", ""),
+    ("D_mfa", ""),
+    ("D_endpoint_security", ""),
+    ("D_backup_freq", ""),
+    ("D_backup_location", ""),
+    ("E_ir_plan", ""),
+    ("E_incidents_5y", ""),
+    ("E_incident_details", ""),
+    ("E_potential_claims", ""),
+    ("E_claim_details", ""),
+    ("F_sectors", []),
+    ("F_other", ""),
+    ("G_amount", ""),
+    ("G_options", []),
+    ("H_supplier_access", ""),
+    ("H_thirdparty_policy", ""),
+    ("H_contract_clauses", ""),
+    ("H_update_policy", ""),
+    ("H_software_list", ""),
+    ("I_dashboards", ""),
+    ("I_reporting_freq", ""),
+    ("J_external_audit", ""),
+    ("J_last_audit_date", ""),
+    ("J_results_to_management", ""),
+    ("K_risky_behaviour_policy", ""),
+    ("K_phishing_sims", ""),
+    ("K_phishing_freq", ""),
+    ("L_byod_policy", ""),
+    ("L_personal_device_security", ""),
+)
 
 
 # ---------------------------------------------------------
 # Scoring logic
 # ---------------------------------------------------------
 
-def calculate_section_scores(responses: dict) -> dict:
+def _section_means_numpy(items: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Mean item score of each averaged section (NumPy fallback)."""
+    return np.add.reduceat(items, starts) / lengths
+
+
+def _section_means_kernel(items, starts, lengths):
+    """Per-section mean over each contiguous item range, written as plain loops for njit."""
+    means = np.empty(starts.shape[0])
+    for s in range(starts.shape[0]):
+        total = 0.0
+        for i in range(starts[s], starts[s] + lengths[s]):
+            total += items[i]
+        means[s] = total / lengths[s]
+    return means
+
+
+@st.cache_resource(show_spinner=False)
+def _compiled_section_means():
+    """
+    numba build of _section_means_kernel, shared by every session.
+    Compiled and warmed once per server process, on the first script run.
+    """
+    from numba import njit
+
+    kernel = njit(_section_means_kernel)
+    # Warm up with the real argument types, so the first submit does not pay the compile
+    kernel(np.zeros(len(_ITEM_KEYS), dtype=np.int16), _SECTION_STARTS, _SECTION_LENGTHS)
+    return kernel
+
+
+# Resolved once per run rather than per scoring call
+_section_means = _compiled_section_means() if NUMBA_AVAILABLE else _section_means_numpy
+
+
+def calculate_section_scores(responses: dict) -> tuple:
     """
-    Given all questionnaire responses, compute a score per section B–L.
+    Given all questionnaire responses, compute a score per section B–L
+    and, in the same pass, the weighted overall score.
     Each section score is in [0, 100].
+    Returns (scores dict for display, overall score).
     """
-    scores = {}
+    scores = dict.fromkeys(SECTION_WEIGHTS)  # B–L, in display order
 
     # ----- Section B: Data and sensitive information -----
-    b_score = data_sensitivity_score(responses["B_types"])
-    scores["B"] = b_score
-
-    # ----- Section C: Organisation and security policies -----
-    c_items = []
-    c_items.append(yes_no_score(responses["C_infosec_policy"]))      # formal infosec policy
-    c_items.append(yes_no_score(responses["C_privacy_policy"]))      # up-to-date privacy policy
-    c_items.append(yes_no_score(responses["C_training"]))            # regular cyber training
-    c_items.append(yes_no_score(responses["C_encryption"]))          # electronic data encrypted
-    c_items.append(yes_no_score(responses["C_access_revocation"]))   # prompt access revocation
-    c_items.append(yes_no_score(responses["C_pentesting"]))          # periodic penetration/vuln tests
-    c_items.append(yes_no_score(responses["C_patch_management"]))    # quick remediation of vulnerabilities
-    scores["C"] = sum(c_items) / len(c_items)
-
-    # ----- Section D: Infrastructure & IT controls -----
-    d_items = []
-    d_items.append(yes_no_score(responses["D_firewall_ids"]))        # firewalls & IDS/IPS
-    d_items.append(yes_no_score(responses["D_malware_protection"]))  # malware protection
-    d_items.append(yes_no_score(responses["D_mfa"]))                 # multi-factor auth
-    d_items.append(yes_no_score(responses["D_endpoint_security"]))   # endpoint protection
-    d_items.append(backup_frequency_score(responses["D_backup_freq"]))  # backup frequency
-    scores["D"] = sum(d_items) / len(d_items)
-
-    # ----- Section E: Incident response & history -----
-    e_items = []
-    e_items.append(yes_no_score(responses["E_ir_plan"]))  # incident response plan
-    # Incidents in last 5 years (No is better)
-    e_items.append(yes_no_score(responses["E_incidents_5y"], yes_value=40, no_value=100))
-    # Events that could lead to a claim (No is better)
-    e_items.append(yes_no_score(responses["E_potential_claims"], yes_value=30, no_value=100))
-    scores["E"] = sum(e_items) / len(e_items)
+    scores["B"] = data_sensitivity_score(responses["B_types"])
+
+    # ----- Sections C, D, E, H, I, J, K, L: mean of item scores -----
+    answers = np.array([responses[key] for key in _ITEM_KEYS])
+    items = np.where(answers == "Yes", _ITEM_YES, _ITEM_NO)
+    for pos, key, scorer in _ORDINAL_ITEMS:
+        items[pos] = scorer(responses[key])
+    means = _section_means(items, _SECTION_STARTS, _SECTION_LENGTHS)
+    scores.update(zip(_AVERAGED_SECTIONS, means.tolist()))
 
     # ----- Section F: Activities & professional exposures -----
     scores["F"] = sector_inherent_risk_score(responses["F_sectors"])
@@ -170,103 +402,118 @@ def calculate_section_scores(responses: dict) -> dict:
     # ----- Section G: Coverage requested -----
     scores["G"] = coverage_awareness_score(responses["G_options"])
 
-    # ----- Section H: Supplier & third-party security -----
-    h_items = []
-    h_items.append(yes_no_score(responses["H_supplier_access"], yes_value=70, no_value=100))
-    h_items.append(yes_no_score(responses["H_thirdparty_policy"]))
-    h_items.append(yes_no_score(responses["H_contract_clauses"]))
-    h_items.append(yes_no_score(responses["H_update_policy"]))
-    scores["H"] = sum(h_items) / len(h_items)
-
-    # ----- Section I: Security indicators & monitoring -----
-    i_items = []
-    i_items.append(yes_no_score(responses["I_dashboards"]))
-    i_items.append(frequency_score(responses["I_reporting_freq"]))
-    scores["I"] = sum(i_items) / len(i_items)
-
-    # ----- Section J: Tests & audits -----
-    j_items = []
-    j_items.append(yes_no_score(responses["J_external_audit"]))
-    j_items.append(yes_no_score(responses["J_results_to_management"]))
-    scores["J"] = sum(j_items) / len(j_items)
-
-    # ----- Section K: Awareness & security culture -----
-    k_items = []
-    k_items.append(yes_no_score(responses["K_risky_behaviour_policy"]))
-    k_items.append(yes_no_score(responses["K_phishing_sims"]))
-    k_items.append(frequency_score(responses["K_phishing_freq"]))
-    scores["K"] = sum(k_items) / len(k_items)
-
-    # ----- Section L: Mobile devices & BYOD -----
-    l_items = []
-    l_items.append(yes_no_score(responses["L_byod_policy"]))
-    l_items.append(yes_no_score(responses["L_personal_device_security"]))
-    scores["L"] = sum(l_items) / len(l_items)
-
-    return scores
-
-
-def calculate_overall_score(section_scores: dict) -> float:
+    scores_vec = np.array([scores[sec] for sec in SECTION_ORDER])
+    return scores, calculate_overall_score(scores_vec)
+
+
+def calculate_overall_score(scores_vec: np.ndarray) -> float:
     """
     Weighted average of section scores according to SECTION_WEIGHTS.
+    `scores_vec` holds the section scores in SECTION_ORDER order.
     """
-    total = 0.0
-    for sec, weight in SECTION_WEIGHTS.items():
-        total += section_scores.get(sec, 0) * weight
-    return total
+    return float(scores_vec @ WEIGHTS_VEC)
+
+
+# Lower bounds of the Weak / Moderate / Strong tiers, and one label per tier
+_RISK_THRESHOLDS = (40, 60, 80)
+_RISK_LABELS = (
+    "High cyber risk / very weak posture",
+    "Weak cyber security posture",
+    "Moderate cyber security posture",
+    "Strong cyber security posture",
+)
+
+# Score buckets for the result card and section cards: below 60, 60–80, 80 and above
+_STATUS_THRESHOLDS = (60, 80)
+
+# Section status (emoji, Streamlit markdown colour) per bucket
+STATUS = (
+    ("❌", "red"),
+    ("⚠️", "orange"),
+    ("✅", "green"),
+)
+
+# High-weight sections flagged in the key insights when they score below 70
+_CRITICAL_SECTIONS = frozenset({"C", "D", "E"})
+
+# Overall score card (CSS class, subtext) per bucket
+_SCORE_BUCKETS = (
+    ("score-low", "Your organisation appears to have a weak cyber security posture and may be exposed to significant risks."),
+    ("score-medium", "Your cyber security posture is moderate. There are controls in place, but there is room for improvement."),
+    ("score-good", "This indicates a strong cyber security posture with good controls in place."),
+)
 
 
 def risk_label(score: float) -> str:
     """Simple interpretation of the overall score."""
-    if score >= 80:
-        return "Strong cyber security posture"
-    elif score >= 60:
-        return "Moderate cyber security posture"
-    elif score >= 40:
-        return "Weak cyber security posture"
-    else:
-        return "High cyber risk / very weak posture"
+    # bisect_right so a score equal to a threshold falls into the tier above
+    return _RISK_LABELS[bisect_right(_RISK_THRESHOLDS, score)]
+
+
+# ---------------------------------------------------------
+# Cached scoring and charts
+# ---------------------------------------------------------
+
+# Part of the cache key for anything that depends on the weights, so editing
+# SECTION_WEIGHTS never serves results computed with the old weights
+WEIGHTS_KEY = tuple(SECTION_WEIGHTS.items())
+
+
+def _freeze(mapping: dict) -> tuple:
+    """
+    Convert a dict of answers or scores into a sorted, hashable tuple usable as a cache key.
+    List answers (multiselects) are converted to sorted tuples.
+    """
+    return tuple(
+        (key, tuple(sorted(value)) if isinstance(value, list) else value)
+        for key, value in sorted(mapping.items())
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _cached_section_scores(resp_tuple: tuple, weights_key: tuple) -> tuple:
+    """
+    Memoized scoring, keyed on a frozen responses tuple and the weights.
+    Returns (section_scores, overall, risk_label) so a cache hit skips all of it.
+    """
+    section_scores, overall = calculate_section_scores(dict(resp_tuple))
+    return section_scores, overall, risk_label(overall)
+
+
+# Figures are kept as shared objects (cache_resource) rather than in cache_data:
+# unpickling a Figure on every hit costs about as much as building it again.
+# Sharing is safe because st.plotly_chart only reads the figure (via to_dict).
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _cached_radar_chart(scores_tuple: tuple):
+    """Memoized create_radar_chart, keyed on the frozen section scores."""
+    return create_radar_chart(dict(scores_tuple))
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _cached_bar_chart(scores_tuple: tuple, weights_key: tuple):
+    """Memoized create_section_bar_chart, keyed on the frozen section scores and weights."""
+    return create_section_bar_chart(dict(scores_tuple))
 
 
 # ---------------------------------------------------------
 # Visualization functions
 # ---------------------------------------------------------
 
-def create_radar_chart(section_scores: dict) -> go.Figure:
-    """Create a radar/spider chart showing performance across sections."""
-    if not PLOTLY_AVAILABLE:
-        return None
-    
-    # Prepare data for radar chart
-    categories = []
-    values = []
-    
-    section_names = {
-        "B": "Data & Sensitive Info",
-        "C": "Policies & Governance",
-        "D": "Infrastructure & IT",
-        "E": "Incident Response",
-        "F": "Sector Risk Profile",
-        "G": "Coverage Awareness",
-        "H": "Third-Party Security",
-        "I": "Monitoring & KPIs",
-        "J": "Tests & Audits",
-        "K": "Security Culture",
-        "L": "Mobile & BYOD"
-    }
-    
-    for sec in ["B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L"]:
-        categories.append(section_names[sec])
-        values.append(section_scores.get(sec, 0))
-    
-    # Close the radar chart by repeating first value
+# Chart skeletons (layout + styled, empty trace) are built once per process.
+# They are shared across sessions, so callers copy them before filling in data.
+
+@st.cache_resource(show_spinner=False)
+def _radar_skeleton() -> "go.Figure":
+    """Radar chart layout and trace styling, without the score values."""
+    go = _plotly()
+    categories = [SECTION_NAMES[sec] for sec in SECTION_ORDER]
+    # Close the radar chart by repeating first category
     categories.append(categories[0])
-    values.append(values[0])
-    
+
     fig = go.Figure()
     
     fig.add_trace(go.Scatterpolar(
-        r=values,
+        r=[],
         theta=categories,
         fill='toself',
         name='Your Score',
@@ -296,48 +543,16 @@ def create_radar_chart(section_scores: dict) -> go.Figure:
     return fig
 
 
-def create_section_bar_chart(section_scores: dict) -> go.Figure:
-    """Create a horizontal bar chart showing section scores with weights."""
-    if not PLOTLY_AVAILABLE:
-        return None
-    
-    section_names = {
-        "B": "Data & Sensitive Info",
-        "C": "Policies & Governance",
-        "D": "Infrastructure & IT",
-        "E": "Incident Response",
-        "F": "Sector Risk Profile",
-        "G": "Coverage Awareness",
-        "H": "Third-Party Security",
-        "I": "Monitoring & KPIs",
-        "J": "Tests & Audits",
-        "K": "Security Culture",
-        "L": "Mobile & BYOD"
-    }
-    
-    sections = ["C", "D", "E", "H", "B", "I", "J", "K", "F", "G", "L"]  # Sorted by weight
-    names = [section_names[s] for s in sections]
-    scores = [section_scores.get(s, 0) for s in sections]
-    weights = [SECTION_WEIGHTS[s] * 100 for s in sections]
-    
-    # Color based on score
-    colors = []
-    for score in scores:
-        if score >= 80:
-            colors.append('#1e8e3e')  # green
-        elif score >= 60:
-            colors.append('#fbbc04')  # yellow
-        else:
-            colors.append('#d93025')  # red
-    
+@st.cache_resource(show_spinner=False)
+def _bar_skeleton() -> "go.Figure":
+    """Section bar chart layout and trace styling, without the score values."""
+    go = _plotly()
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        y=names,
-        x=scores,
+        y=[SECTION_NAMES[s] for s in SORTED_SECTIONS_BY_WEIGHT],
+        x=[],
         orientation='h',
-        marker=dict(color=colors),
-        text=[f"{s:.0f}% (weight: {w:.0f}%)" for s, w in zip(scores, weights)],
         textposition='auto',
         textfont=dict(size=10, color='white')
     ))
@@ -362,40 +577,75 @@ def create_section_bar_chart(section_scores: dict) -> go.Figure:
     return fig
 
 
+def create_radar_chart(section_scores: dict) -> "go.Figure":
+    """Create a radar/spider chart showing performance across sections."""
+    if not PLOTLY_AVAILABLE:
+        return None
+    
+    # Prepare data for radar chart
+    values = [section_scores.get(sec, 0) for sec in SECTION_ORDER]
+    
+    # Close the radar chart by repeating first value
+    values.append(values[0])
+    
+    fig = _plotly().Figure(_radar_skeleton())
+    fig.data[0].r = values
+    return fig
+
+
+def create_section_bar_chart(section_scores: dict) -> "go.Figure":
+    """Create a horizontal bar chart showing section scores with weights."""
+    if not PLOTLY_AVAILABLE:
+        return None
+    
+    sections = SORTED_SECTIONS_BY_WEIGHT
+    scores = [section_scores.get(s, 0) for s in sections]
+    weights = [SECTION_WEIGHT_PCT[s] for s in sections]
+    
+    # Color based on score: green >= 80, yellow >= 60, red otherwise
+    scores_arr = np.asarray(scores)
+    colors = np.select(
+        [scores_arr >= 80, scores_arr >= 60], ['#1e8e3e', '#fbbc04'], default='#d93025'
+    ).tolist()
+    text = [f"{s:.0f}% (weight: {w:.0f}%)" for s, w in zip(scores, weights)]
+    
+    fig = _plotly().Figure(_bar_skeleton())
+    bar = fig.data[0]
+    bar.x = scores
+    bar.marker.color = colors
+    bar.text = text
+    return fig
+
+
 # ---------------------------------------------------------
 # PDF generation helpers
 # ---------------------------------------------------------
 
 def _wrap_text(text: str, max_chars: int = 90):
     """Simple word-wrap to avoid overflowing PDF lines."""
-    words = str(text).split()
-    lines = []
-    line = ""
-    for w in words:
-        if len(line) + len(w) + 1 <= max_chars:
-            line = f"{line} {w}".strip()
-        else:
-            lines.append(line)
-            line = w
-    if line:
-        lines.append(line)
-    return lines
+    # Long words (e.g. URLs) are kept whole, as before
+    return textwrap.wrap(
+        str(text), width=max_chars, break_long_words=False, break_on_hyphens=False
+    ) or [""]
 
 
-def generate_pdf(all_answers: dict, section_scores: dict, overall: float, label: str) -> BytesIO:
+def generate_pdf(
+    all_answers: dict, section_scores: dict, overall: float, label: str, timestamp: str
+) -> BytesIO:
     """
     Generate a PDF report with overall score, section scores and questionnaire answers.
+    `timestamp` is printed in the footer of every page.
     Returns a BytesIO buffer containing the PDF.
+    Imports reportlab on first use; raises RuntimeError if it is not installed.
     """
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import A4
+    if not REPORTLAB_AVAILABLE:
+        raise RuntimeError("PDF export requires the reportlab package")
+    canvas, A4 = _reportlab()
 
     buffer = BytesIO()
     c = canvas.Canvas(buffer, pagesize=A4)
     width, height = A4
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-
     def draw_header_footer():
         """Draw Cybastion/Riskare header and footer with date & confidentiality."""
         c.setFont("Helvetica-Bold", 14)
@@ -423,31 +673,26 @@ def generate_pdf(all_answers: dict, section_scores: dict, overall: float, label:
     c.drawString(40, y, "Section Scores (with weights)")
     y -= 18
 
-    c.setFont("Helvetica", 10)
-    section_names = {
-        "B": "Data & Sensitive Info",
-        "C": "Policies & Governance",
-        "D": "Infrastructure & IT",
-        "E": "Incident Response",
-        "F": "Sector Risk Profile",
-        "G": "Coverage Awareness",
-        "H": "Third-Party Security",
-        "I": "Monitoring & KPIs",
-        "J": "Tests & Audits",
-        "K": "Security Culture",
-        "L": "Mobile & BYOD"
-    }
-    
-    for sec in sorted(section_scores.keys()):
-        weight_pct = SECTION_WEIGHTS[sec] * 100
-        c.drawString(50, y, f"Section {sec} - {section_names[sec]}: {section_scores[sec]:.1f}/100 (weight: {weight_pct:.0f}%)")
+    score_lines = [
+        f"Section {sec} - {SECTION_NAMES[sec]}: {section_scores[sec]:.1f}/100 (weight: {SECTION_WEIGHT_PCT[sec]:.0f}%)"
+        for sec in sorted(section_scores.keys())
+    ]
+
+    # One text object per page instead of one drawString per line
+    text = c.beginText(50, y)
+    text.setFont("Helvetica", 10, 14)
+    for line in score_lines:
+        text.textLine(line)
         y -= 14
 
         if y < 80:
+            c.drawText(text)
             c.showPage()
             draw_header_footer()
             y = height - 80
-            c.setFont("Helvetica", 10)
+            text = c.beginText(50, y)
+            text.setFont("Helvetica", 10, 14)
+    c.drawText(text)
 
     # Questionnaire responses
     y -= 10
@@ -455,31 +700,161 @@ def generate_pdf(all_answers: dict, section_scores: dict, overall: float, label:
     c.drawString(40, y, "Questionnaire Responses")
     y -= 18
 
-    c.setFont("Helvetica", 9)
-    for key, value in all_answers.items():
-        if isinstance(value, list):
-            display_value = ", ".join(value) if value else "None"
-        else:
-            display_value = value if value not in ("", None) else "None"
-
-        text_line = f"{key}: {display_value}"
+    # Format every answer up front so the emit loop only handles strings
+    rendered = {
+        key: (", ".join(value) if value else "None") if isinstance(value, (list, tuple))
+        else (value if value not in ("", None) else "None")
+        for key, value in all_answers.items()
+    }
 
-        for line in _wrap_text(text_line, max_chars=95):
-            c.drawString(50, y, line)
+    text = c.beginText(50, y)
+    text.setFont("Helvetica", 9, 12)
+    for key, display_value in rendered.items():
+        for line in _wrap_text(f"{key}: {display_value}", max_chars=95):
+            text.textLine(line)
             y -= 12
 
             if y < 60:
+                c.drawText(text)
                 c.showPage()
                 draw_header_footer()
                 y = height - 80
-                c.setFont("Helvetica", 9)
+                text = c.beginText(50, y)
+                text.setFont("Helvetica", 9, 12)
 
+    c.drawText(text)
     c.showPage()
     c.save()
     buffer.seek(0)
     return buffer
 
 
+@st.cache_resource(ttl=3600, max_entries=16, show_spinner=False)
+def _cached_pdf(answers_tuple: tuple, scores_tuple: tuple, overall: float, label: str, timestamp: str) -> bytes:
+    """
+    Memoized generate_pdf, keyed on ordered (key, answer) pairs and the section scores.
+    The minute-resolution timestamp is part of the key, so a cached report never
+    carries a stale footer date.
+    Returns raw PDF bytes rather than a BytesIO. The bytes are immutable, so one
+    copy is shared by every session (cache_resource) instead of being unpickled
+    on each hit.
+    """
+    return generate_pdf(dict(answers_tuple), dict(scores_tuple), overall, label, timestamp).getvalue()
+
+
+# ---------------------------------------------------------
+# Static page markup (built once at import, re-sent unchanged on each rerun)
+# ---------------------------------------------------------
+
+_CSS_HTML = """
+<style>
+.block-container {
+    max-width: 1400px;
+    padding-top: 2rem;
+    margin: 0 auto;
+}
+
+.stButton > button,
+.stFormSubmitButton > button {
+    background: linear-gradient(90deg, #1f77b4, #4dabf7);
+    color: white;
+    padding: 0.8rem 1.8rem;
+    border-radius: 999px;
+    border: none;
+    font-size: 1.1rem;
+    font-weight: 600;
+    box-shadow: 0 4px 12px rgba(31, 119, 180, 0.35);
+}
+.stButton > button:hover,
+.stFormSubmitButton > button:hover {
+    filter: brightness(1.05);
+    box-shadow: 0 6px 16px rgba(31, 119, 180, 0.45);
+}
+
+.score-card {
+    border-radius: 16px;
+    padding: 1.5rem 1.75rem;
+    margin-top: 1.5rem;
+    box-shadow: 0 12px 30px rgba(15, 23, 42, 0.12);
+    border-left: 6px solid transparent;
+}
+.score-card-title {
+    font-size: 0.95rem;
+    text-transform: uppercase;
+    letter-spacing: 0.08em;
+    opacity: 0.7;
+    margin-bottom: 0.25rem;
+}
+.score-card-value {
+    font-size: 2.4rem;
+    font-weight: 700;
+    line-height: 1.1;
+}
+.score-card-label {
+    margin-top: 0.5rem;
+    font-size: 1rem;
+}
+.score-subtext {
+    margin-top: 0.75rem;
+    font-size: 0.9rem;
+    opacity: 0.88;
+}
+.score-good {
+    background: #e6f4ea;
+    border-left-color: #1e8e3e;
+}
+.score-medium {
+    background: #fff8e1;
+    border-left-color: #fbbc04;
+}
+.score-low {
+    background: #fce8e6;
+    border-left-color: #d93025;
+}
+</style>
+"""
+
+_BRAND_LEFT_HTML = "<div style='margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Cybastion</div>"
+_BRAND_RIGHT_HTML = (
+    "<div style='text-align: right; margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Riskare</div>"
+)
+
+# Title and "About this assessment" box, sent as a single element
+_INTRO_HTML = """
+<h1 style='text-align: center; margin-top: 0.4rem; margin-bottom: 0.6rem;'>Cyber Security Scoring App</h1>
+
+<div style="
+    margin: 0.5rem 0 1.5rem 0;
+    padding: 0.85rem 1.1rem;
+    border-radius: 12px;
+    background: #f5f5f7;
+    border: 1px solid #e5e7eb;
+    font-size: 0.95rem;
+">
+    <strong>About this assessment</strong><br/>
+    This cyber security scoring app provides an indicative view of your organisation's cyber security posture,
+    based on governance, technical controls, incident preparedness and user awareness.
+</div>
+"""
+
+_SECTION2_SEPARATOR_HTML = (
+    '<div style="margin-top: 3rem; border-top: 3px solid #e5e7eb; padding-top: 1.5rem;"></div>'
+)
+_SECTION3_SEPARATOR_HTML = (
+    '<div style="margin-top: 2.5rem; border-top: 2px solid #e5e7eb; padding-top: 1rem;"></div>'
+)
+
+# Overall score card; only the values are substituted on each render
+_SCORE_CARD_TPL = Template("""
+<div class="score-card $score_class">
+    <div class="score-card-title">Overall Cyber Security Score</div>
+    <div class="score-card-value">$overall / 100</div>
+    <div class="score-card-label"><strong>$label</strong></div>
+    <div class="score-subtext">$subtext</div>
+</div>
+""")
+
+
 # ---------------------------------------------------------
 # Streamlit UI
 # ---------------------------------------------------------
@@ -492,131 +867,43 @@ def main():
         st.session_state.initialized = True
 
     # ---------- SIMPLE ACCESS CODE GATE ----------
+    # Shown until the code has been validated once in this session
     ACCESS_CODE = "Cybastion2025"
 
-    st.markdown(
-        "<h2 style='text-align:center; margin-top:0;'>Secure Access</h2>",
-        unsafe_allow_html=True,
-    )
+    if not st.session_state.get("authed"):
+        st.markdown(
+            "<h2 style='text-align:center; margin-top:0;'>Secure Access</h2>",
+            unsafe_allow_html=True,
+        )
 
-    user_code = st.text_input(
-        "Enter the access code to continue:",
-        type="password",
-        help="This assessment is restricted to authorised clients only.",
-    )
+        user_code = st.text_input(
+            "Enter the access code to continue:",
+            type="password",
+            help="This assessment is restricted to authorised clients only.",
+        )
+
+        # Constant-time comparison, so response timing does not leak the code
+        if user_code and hmac.compare_digest(user_code.encode(), ACCESS_CODE.encode()):
+            st.session_state.authed = True
+            st.rerun()
 
-    if user_code != ACCESS_CODE:
         st.warning("Please enter the correct access code to access the assessment.")
         st.stop()
 
     # ---------- Custom CSS ----------
-    st.markdown(
-        """
-        <style>
-        .block-container {
-            max-width: 1400px;
-            padding-top: 2rem;
-            margin: 0 auto;
-        }
-
-        .stButton > button {
-            background: linear-gradient(90deg, #1f77b4, #4dabf7);
-            color: white;
-            padding: 0.8rem 1.8rem;
-            border-radius: 999px;
-            border: none;
-            font-size: 1.1rem;
-            font-weight: 600;
-            box-shadow: 0 4px 12px rgba(31, 119, 180, 0.35);
-        }
-        .stButton > button:hover {
-            filter: brightness(1.05);
-            box-shadow: 0 6px 16px rgba(31, 119, 180, 0.45);
-        }
-
-        .score-card {
-            border-radius: 16px;
-            padding: 1.5rem 1.75rem;
-            margin-top: 1.5rem;
-            box-shadow: 0 12px 30px rgba(15, 23, 42, 0.12);
-            border-left: 6px solid transparent;
-        }
-        .score-card-title {
-            font-size: 0.95rem;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            opacity: 0.7;
-            margin-bottom: 0.25rem;
-        }
-        .score-card-value {
-            font-size: 2.4rem;
-            font-weight: 700;
-            line-height: 1.1;
-        }
-        .score-card-label {
-            margin-top: 0.5rem;
-            font-size: 1rem;
-        }
-        .score-subtext {
-            margin-top: 0.75rem;
-            font-size: 0.9rem;
-            opacity: 0.88;
-        }
-        .score-good {
-            background: #e6f4ea;
-            border-left-color: #1e8e3e;
-        }
-        .score-medium {
-            background: #fff8e1;
-            border-left-color: #fbbc04;
-        }
-        .score-low {
-            background: #fce8e6;
-            border-left-color: #d93025;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_CSS_HTML, unsafe_allow_html=True)
 
     # ---------- HEADER WITH "LOGOS" AND TITLE ----------
     header_cols = st.columns([1, 2, 1])
 
     with header_cols[0]:
-        st.markdown(
-            "<div style='margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Cybastion</div>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_BRAND_LEFT_HTML, unsafe_allow_html=True)
 
     with header_cols[2]:
-        st.markdown(
-            "<div style='text-align: right; margin-top: 0.4rem; font-weight: 700; font-size: 1.1rem;'>Riskare</div>",
-            unsafe_allow_html=True,
-        )
-
-    st.markdown(
-        "<h1 style='text-align: center; margin-top: 0.4rem; margin-bottom: 0.6rem;'>Cyber Security Scoring App</h1>",
-        unsafe_allow_html=True,
-    )
+        st.markdown(_BRAND_RIGHT_HTML, unsafe_allow_html=True)
 
-    # ---------- ABOUT THIS ASSESSMENT BOX ----------
-    st.markdown(
-        """
-        <div style="
-            margin: 0.5rem 0 1.5rem 0;
-            padding: 0.85rem 1.1rem;
-            border-radius: 12px;
-            background: #f5f5f7;
-            border: 1px solid #e5e7eb;
-            font-size: 0.95rem;
-        ">
-            <strong>About this assessment</strong><br/>
-            This cyber security scoring app provides an indicative view of your organisation's cyber security posture,
-            based on governance, technical controls, incident preparedness and user awareness.
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    # ---------- TITLE AND ABOUT THIS ASSESSMENT BOX ----------
+    st.markdown(_INTRO_HTML, unsafe_allow_html=True)
 
     st.write(
         """
@@ -627,459 +914,378 @@ def main():
     )
 
     # ---------- SECTION 1: QUESTIONNAIRE ----------
-    st.markdown("## 1. Questionnaire")
+    # Batch all answers in one form so the app only reruns on submit
+    with st.form("assessment", clear_on_submit=False):
+        st.markdown("## 1. Questionnaire")
 
-    # A. General Information (not scored)
-    with st.expander("📋 **Section A: General Information**", expanded=True):
-        st.markdown("*Basic information about your organisation (not scored)*")
+        # A. General Information (not scored)
+        with st.expander("📋 **Section A: General Information**", expanded=True):
+            st.markdown("*Basic information about your organisation (not scored)*")
         
-        a_company_name = st.text_input("Legal entity name", key="A_company_name")
-        a_address = st.text_input("Registered office address", key="A_address")
-        a_websites = st.text_input("Website(s) / Domain(s)", key="A_websites")
-        a_activity = st.text_area("Description of activity", key="A_activity")
-        a_employees = st.text_input("Number of employees", key="A_employees")
-        a_revenue = st.text_input("Annual turnover (last financial year, currency)", key="A_revenue")
-        a_years = st.text_input("Years in operation", key="A_years")
-        a_contact = st.text_area(
-            "Primary cybersecurity contact (Name, Role, Email, Phone)", key="A_contact"
-        )
+            a_company_name = st.text_input("Legal entity name", key="A_company_name")
+            a_address = st.text_input("Registered office address", key="A_address")
+            a_websites = st.text_input("Website(s) / Domain(s)", key="A_websites")
+            a_activity = st.text_area("Description of activity", key="A_activity")
+            a_employees = st.text_input("Number of employees", key="A_employees")
+            a_revenue = st.text_input("Annual turnover (last financial year, currency)", key="A_revenue")
+            a_years = st.text_input("Years in operation", key="A_years")
+            a_contact = st.text_area(
+                "Primary cybersecurity contact (Name, Role, Email, Phone)", key="A_primary_contact"
+            )
 
-    # B. Data & sensitive information
-    with st.expander("🔒 **Section B: Data and Sensitive Information** (Weight: 8%)", expanded=False):
-        st.markdown("*Information about the types of sensitive data your organisation handles*")
+        # B. Data & sensitive information
+        with st.expander("🔒 **Section B: Data and Sensitive Information** (Weight: 8%)", expanded=False):
+            st.markdown("*Information about the types of sensitive data your organisation handles*")
         
-        b_types = st.multiselect(
-            "What types of sensitive information do you store or process? (select all that apply)",
-            options=[
-                "Payment cards / debit / Mobile Money information",
-                "Medical records",
-                "Financial accounts",
-                "Official ID documents or other identity information",
-                "Intellectual property",
-                "Other sensitive data",
-            ],
-            key="B_types"
-        )
+            b_types = st.multiselect(
+                "What types of sensitive information do you store or process? (select all that apply)",
+                options=[
+                    "Payment cards / debit / Mobile Money information",
+                    "Medical records",
+                    "Financial accounts",
+                    "Official ID documents or other identity information",
+                    "Intellectual property",
+                    "Other sensitive data",
+                ],
+                key="B_types"
+            )
 
-    # C. Organisation and security policies
-    with st.expander("📜 **Section C: Organisation and Security Policies** (Weight: 25%) - CRITICAL", expanded=False):
-        st.markdown("*Governance and policy framework - **this section has the highest weight***")
+        # C. Organisation and security policies
+        with st.expander("📜 **Section C: Organisation and Security Policies** (Weight: 25%) - CRITICAL", expanded=False):
+            st.markdown("*Governance and policy framework - **this section has the highest weight***")
         
-        c_infosec_policy = st.radio(
-            "Do you have a formal information security policy?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="C_infosec_policy"
-        )
-        c_privacy_policy = st.radio(
-            "Do you have an up-to-date privacy policy?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="C_privacy_policy"
-        )
-        c_training = st.radio(
-            "Do employees receive regular cybersecurity awareness training?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="C_training"
-        )
-        c_encryption = st.radio(
-            "Are electronic data encrypted (at rest and/or in transit)?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="C_encryption"
-        )
-        c_encryption_details = st.text_input(
-            "If yes, specify media/systems where encryption is used",
-            key="C_encryption_details"
-        )
-        c_access_revocation = st.radio(
-            "Are user access rights removed promptly when staff leave or change roles?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="C_access_revocation"
-        )
-        c_pentesting = st.radio(
-            "Do you perform periodic penetration tests or vulnerability assessments?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="C_pentesting"
-        )
-        c_patch_management = st.radio(
-            "Are identified vulnerabilities corrected quickly (patch management process)?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="C_patch_management"
-        )
+            c_infosec_policy = st.radio(
+                "Do you have a formal information security policy?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="C_infosec_policy"
+            )
+            c_privacy_policy = st.radio(
+                "Do you have an up-to-date privacy policy?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="C_privacy_policy"
+            )
+            c_training = st.radio(
+                "Do employees receive regular cybersecurity awareness training?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="C_training"
+            )
+            c_encryption = st.radio(
+                "Are electronic data encrypted (at rest and/or in transit)?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="C_encryption"
+            )
+            c_encryption_details = st.text_input(
+                "If yes, specify media/systems where encryption is used",
+                key="C_encryption_details"
+            )
+            c_access_revocation = st.radio(
+                "Are user access rights removed promptly when staff leave or change roles?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="C_access_revocation"
+            )
+            c_pentesting = st.radio(
+                "Do you perform periodic penetration tests or vulnerability assessments?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="C_pentesting"
+            )
+            c_patch_management = st.radio(
+                "Are identified vulnerabilities corrected quickly (patch management process)?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="C_patch_management"
+            )
 
-    # D. Infrastructure and IT controls
-    with st.expander("🖥️ **Section D: Infrastructure and IT Controls** (Weight: 20%) - CRITICAL", expanded=False):
-        st.markdown("*Technical security controls - **second highest weight***")
+        # D. Infrastructure and IT controls
+        with st.expander("🖥️ **Section D: Infrastructure and IT Controls** (Weight: 20%) - CRITICAL", expanded=False):
+            st.markdown("*Technical security controls - **second highest weight***")
         
-        d_firewall_ids = st.radio(
-            "Do you have firewalls and intrusion detection/prevention systems in place?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="D_firewall_ids"
-        )
-        d_malware_protection = st.radio(
-            "Do you have malware protection for remote access, email, and mobile devices?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="D_malware_protection"
-        )
-        d_mfa = st.radio(
-            "Do you use multi-factor authentication (MFA) for critical systems?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="D_mfa"
-        )
-        d_endpoint_security = st.radio(
-            "Is endpoint protection deployed across the network?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="D_endpoint_security"
-        )
-        d_backup_freq = st.selectbox(
-            "What is the frequency of your data backups?",
-            options=[
-                "No regular backups",
-                "Monthly",
-                "Weekly",
-                "Daily or more often",
-            ],
-            key="D_backup_freq"
-        )
-        d_backup_location = st.text_input(
-            "Where are backups stored? (on-site / off-site / cloud, etc.)",
-            key="D_backup_location"
-        )
+            d_firewall_ids = st.radio(
+                "Do you have firewalls and intrusion detection/prevention systems in place?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="D_firewall_ids"
+            )
+            d_malware_protection = st.radio(
+                "Do you have malware protection for remote access, email, and mobile devices?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="D_malware_protection"
+            )
+            d_mfa = st.radio(
+                "Do you use multi-factor authentication (MFA) for critical systems?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="D_mfa"
+            )
+            d_endpoint_security = st.radio(
+                "Is endpoint protection deployed across the network?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="D_endpoint_security"
+            )
+            d_backup_freq = st.selectbox(
+                "What is the frequency of your data backups?",
+                options=[
+                    "No regular backups",
+                    "Monthly",
+                    "Weekly",
+                    "Daily or more often",
+                ],
+                key="D_backup_freq"
+            )
+            d_backup_location = st.text_input(
+                "Where are backups stored? (on-site / off-site / cloud, etc.)",
+                key="D_backup_location"
+            )
 
-    # E. Incident response and history
-    with st.expander("🚨 **Section E: Incident Response and History** (Weight: 15%)", expanded=False):
-        st.markdown("*Preparedness for and history of security incidents*")
+        # E. Incident response and history
+        with st.expander("🚨 **Section E: Incident Response and History** (Weight: 15%)", expanded=False):
+            st.markdown("*Preparedness for and history of security incidents*")
         
-        e_ir_plan = st.radio(
-            "Do you have a formal incident response plan?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="E_ir_plan"
-        )
-        e_incidents_5y = st.radio(
-            "Have you experienced any cyber incidents in the last 5 years?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="E_incidents_5y"
-        )
-        e_incident_details = st.text_area(
-            "If yes, briefly describe the incidents",
-            key="E_incident_details"
-        )
-        e_potential_claims = st.radio(
-            "Are you aware of any events that could lead to a cyber insurance claim?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="E_potential_claims"
-        )
-        e_claim_details = st.text_area(
-            "If yes, briefly describe these events",
-            key="E_claim_details"
-        )
+            e_ir_plan = st.radio(
+                "Do you have a formal incident response plan?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="E_ir_plan"
+            )
+            e_incidents_5y = st.radio(
+                "Have you experienced any cyber incidents in the last 5 years?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="E_incidents_5y"
+            )
+            e_incident_details = st.text_area(
+                "If yes, briefly describe the incidents",
+                key="E_incident_details"
+            )
+            e_potential_claims = st.radio(
+                "Are you aware of any events that could lead to a cyber insurance claim?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="E_potential_claims"
+            )
+            e_claim_details = st.text_area(
+                "If yes, briefly describe these events",
+                key="E_claim_details"
+            )
 
-    # F. Activities and professional exposures
-    with st.expander("🏢 **Section F: Activities and Professional Exposures** (Weight: 3%)", expanded=False):
-        st.markdown("*Industry sector and inherent risk profile*")
+        # F. Activities and professional exposures
+        with st.expander("🏢 **Section F: Activities and Professional Exposures** (Weight: 3%)", expanded=False):
+            st.markdown("*Industry sector and inherent risk profile*")
         
-        f_sectors = st.multiselect(
-            "Which of the following sectors best describe your organisation? (select all that apply)",
-            options=[
-                "Water and Energy (electricity, gas, oil, water)",
-                "Financial institution (bank, insurance, microfinance, collection, etc.)",
-                "Sports betting / gambling",
-                "Telecommunications / new technologies",
-                "Healthcare / medical / provident fund",
-                "Commerce / agro-industry",
-                "Other",
-            ],
-            key="F_sectors"
-        )
-        f_other = st.text_input("If 'Other', please specify", key="F_other")
+            f_sectors = st.multiselect(
+                "Which of the following sectors best describe your organisation? (select all that apply)",
+                options=[
+                    "Water and Energy (electricity, gas, oil, water)",
+                    "Financial institution (bank, insurance, microfinance, collection, etc.)",
+                    "Sports betting / gambling",
+                    "Telecommunications / new technologies",
+                    "Healthcare / medical / provident fund",
+                    "Commerce / agro-industry",
+                    "Other",
+                ],
+                key="F_sectors"
+            )
+            f_other = st.text_input("If 'Other', please specify", key="F_other")
 
-    # G. Requested coverage details
-    with st.expander("💼 **Section G: Requested Coverage Details** (Weight: 2%)", expanded=False):
-        st.markdown("*Insurance coverage interests (indicates risk awareness)*")
+        # G. Requested coverage details
+        with st.expander("💼 **Section G: Requested Coverage Details** (Weight: 2%)", expanded=False):
+            st.markdown("*Insurance coverage interests (indicates risk awareness)*")
         
-        g_amount = st.text_input(
-            "Desired insured amount and deductible (not directly scored)",
-            key="G_amount"
-        )
-        g_options = st.multiselect(
-            "Which coverage options are you interested in? (select all that apply)",
-            options=[
-                "Business interruption",
-                "Data restoration",
-                "Ransomware / cyber extortion",
-                "Social engineering fraud",
-                "Regulatory fines",
-                "Reputational harm",
-                "Media liability",
-            ],
-            key="G_options"
-        )
+            g_amount = st.text_input(
+                "Desired insured amount and deductible (not directly scored)",
+                key="G_amount"
+            )
+            g_options = st.multiselect(
+                "Which coverage options are you interested in? (select all that apply)",
+                options=[
+                    "Business interruption",
+                    "Data restoration",
+                    "Ransomware / cyber extortion",
+                    "Social engineering fraud",
+                    "Regulatory fines",
+                    "Reputational harm",
+                    "Media liability",
+                ],
+                key="G_options"
+            )
 
-    # H. Supplier and third-party security
-    with st.expander("🤝 **Section H: Supplier and Third-Party Security** (Weight: 10%)", expanded=False):
-        st.markdown("*Supply chain and vendor security management*")
+        # H. Supplier and third-party security
+        with st.expander("🤝 **Section H: Supplier and Third-Party Security** (Weight: 10%)", expanded=False):
+            st.markdown("*Supply chain and vendor security management*")
         
-        h_supplier_access = st.radio(
-            "Do suppliers or third parties have access to your systems or sensitive data?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="H_supplier_access"
-        )
-        h_thirdparty_policy = st.radio(
-            "Do you have a security policy for third parties?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="H_thirdparty_policy"
-        )
-        h_contract_clauses = st.radio(
-            "Do your contracts include cybersecurity clauses with suppliers?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="H_contract_clauses"
-        )
-        h_update_policy = st.radio(
-            "Do you have a policy for keeping software up to date?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="H_update_policy"
-        )
-        h_software_list = st.text_area(
-            "List key software used in your organisation",
-            key="H_software_list"
-        )
+            h_supplier_access = st.radio(
+                "Do suppliers or third parties have access to your systems or sensitive data?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="H_supplier_access"
+            )
+            h_thirdparty_policy = st.radio(
+                "Do you have a security policy for third parties?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="H_thirdparty_policy"
+            )
+            h_contract_clauses = st.radio(
+                "Do your contracts include cybersecurity clauses with suppliers?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="H_contract_clauses"
+            )
+            h_update_policy = st.radio(
+                "Do you have a policy for keeping software up to date?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="H_update_policy"
+            )
+            h_software_list = st.text_area(
+                "List key software used in your organisation",
+                key="H_software_list"
+            )
 
-    # I. Security indicators and monitoring
-    with st.expander("📊 **Section I: Security Indicators and Monitoring** (Weight: 5%)", expanded=False):
-        st.markdown("*Metrics and reporting for security oversight*")
+        # I. Security indicators and monitoring
+        with st.expander("📊 **Section I: Security Indicators and Monitoring** (Weight: 5%)", expanded=False):
+            st.markdown("*Metrics and reporting for security oversight*")
         
-        i_dashboards = st.radio(
-            "Do you use dashboards or KPIs to monitor cyber security?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="I_dashboards"
-        )
-        i_reporting_freq = st.selectbox(
-            "How often are security reports provided to management?",
-            options=[
-                "Ad hoc / not defined",
-                "Annually",
-                "Quarterly",
-                "Monthly",
-                "Weekly or more often",
-            ],
-            key="I_reporting_freq"
-        )
+            i_dashboards = st.radio(
+                "Do you use dashboards or KPIs to monitor cyber security?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="I_dashboards"
+            )
+            i_reporting_freq = st.selectbox(
+                "How often are security reports provided to management?",
+                options=[
+                    "Ad hoc / not defined",
+                    "Annually",
+                    "Quarterly",
+                    "Monthly",
+                    "Weekly or more often",
+                ],
+                key="I_reporting_freq"
+            )
 
-    # J. Tests and audits
-    with st.expander("🔍 **Section J: Tests and Audits** (Weight: 5%)", expanded=False):
-        st.markdown("*External validation and assurance activities*")
+        # J. Tests and audits
+        with st.expander("🔍 **Section J: Tests and Audits** (Weight: 5%)", expanded=False):
+            st.markdown("*External validation and assurance activities*")
         
-        j_external_audit = st.radio(
-            "Have you had an external security audit performed?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="J_external_audit"
-        )
-        j_last_audit_date = st.text_input(
-            "If yes, date of the last audit",
-            key="J_last_audit_date"
-        )
-        j_results_to_management = st.radio(
-            "Were the audit results shared with senior management?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="J_results_to_management"
-        )
+            j_external_audit = st.radio(
+                "Have you had an external security audit performed?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="J_external_audit"
+            )
+            j_last_audit_date = st.text_input(
+                "If yes, date of the last audit",
+                key="J_last_audit_date"
+            )
+            j_results_to_management = st.radio(
+                "Were the audit results shared with senior management?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="J_results_to_management"
+            )
 
-    # K. Awareness and security culture
-    with st.expander("👥 **Section K: Awareness and Security Culture** (Weight: 5%)", expanded=False):
-        st.markdown("*Human factor and security awareness*")
+        # K. Awareness and security culture
+        with st.expander("👥 **Section K: Awareness and Security Culture** (Weight: 5%)", expanded=False):
+            st.markdown("*Human factor and security awareness*")
         
-        k_risky_behaviour_policy = st.radio(
-            "Do you have a policy for managing risky user behaviour (e.g., clear rules on acceptable use)?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="K_risky_behaviour_policy"
-        )
-        k_phishing_sims = st.radio(
-            "Do you conduct phishing simulations?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="K_phishing_sims"
-        )
-        k_phishing_freq = st.selectbox(
-            "If yes, how often are phishing simulations carried out?",
-            options=[
-                "Ad hoc / not defined",
-                "Annually",
-                "Quarterly",
-                "Monthly",
-                "Weekly or more often",
-            ],
-            key="K_phishing_freq"
-        )
+            k_risky_behaviour_policy = st.radio(
+                "Do you have a policy for managing risky user behaviour (e.g., clear rules on acceptable use)?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="K_risky_behaviour_policy"
+            )
+            k_phishing_sims = st.radio(
+                "Do you conduct phishing simulations?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="K_phishing_sims"
+            )
+            k_phishing_freq = st.selectbox(
+                "If yes, how often are phishing simulations carried out?",
+                options=[
+                    "Ad hoc / not defined",
+                    "Annually",
+                    "Quarterly",
+                    "Monthly",
+                    "Weekly or more often",
+                ],
+                key="K_phishing_freq"
+            )
 
-    # L. Mobile devices and BYOD
-    with st.expander("📱 **Section L: Mobile Devices and BYOD** (Weight: 2%)", expanded=False):
-        st.markdown("*Mobile device management and personal device security*")
+        # L. Mobile devices and BYOD
+        with st.expander("📱 **Section L: Mobile Devices and BYOD** (Weight: 2%)", expanded=False):
+            st.markdown("*Mobile device management and personal device security*")
         
-        l_byod_policy = st.radio(
-            "Do you have a Bring Your Own Device (BYOD) policy?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="L_byod_policy"
-        )
-        l_personal_device_security = st.radio(
-            "Are personal devices required to use security controls (e.g., MDM, encryption, PIN/biometrics)?",
-            options=["Yes", "No"],
-            horizontal=True,
-            key="L_personal_device_security"
-        )
+            l_byod_policy = st.radio(
+                "Do you have a Bring Your Own Device (BYOD) policy?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="L_byod_policy"
+            )
+            l_personal_device_security = st.radio(
+                "Are personal devices required to use security controls (e.g., MDM, encryption, PIN/biometrics)?",
+                options=["Yes", "No"],
+                horizontal=True,
+                key="L_personal_device_security"
+            )
 
-    # ---------- Separator before Section 2 ----------
-    st.markdown(
-        """
-        <div style="margin-top: 3rem; border-top: 3px solid #e5e7eb; padding-top: 1.5rem;"></div>
-        """,
-        unsafe_allow_html=True,
-    )
+        # ---------- Separator before Section 2 ----------
+        st.markdown(_SECTION2_SEPARATOR_HTML, unsafe_allow_html=True)
 
-    # ---------- SECTION 2: SCORE CALCULATION ----------
-    st.markdown("## 2. Score Calculation")
-    st.write("Click the button below to calculate your cyber security score based on the answers above.")
+        # ---------- SECTION 2: SCORE CALCULATION ----------
+        st.markdown("## 2. Score Calculation")
+        st.write("Click the button below to calculate your cyber security score based on the answers above.")
 
-    btn_col1, btn_col2, btn_col3 = st.columns([1, 2, 1])
-    with btn_col2:
-        submitted = st.button(
-            "Calculate Cyber Security Score",
-            use_container_width=True,
-        )
+        btn_col1, btn_col2, btn_col3 = st.columns([1, 2, 1])
+        with btn_col2:
+            submitted = st.form_submit_button(
+                "Calculate Cyber Security Score",
+                use_container_width=True,
+            )
 
+    state = st.session_state
     if submitted:
-        # responses used for scoring (B–L)
-        responses_for_scoring = {
-            "B_types": st.session_state.get("B_types", []),
-            "C_infosec_policy": st.session_state.get("C_infosec_policy", "No"),
-            "C_privacy_policy": st.session_state.get("C_privacy_policy", "No"),
-            "C_training": st.session_state.get("C_training", "No"),
-            "C_encryption": st.session_state.get("C_encryption", "No"),
-            "C_access_revocation": st.session_state.get("C_access_revocation", "No"),
-            "C_pentesting": st.session_state.get("C_pentesting", "No"),
-            "C_patch_management": st.session_state.get("C_patch_management", "No"),
-            "D_firewall_ids": st.session_state.get("D_firewall_ids", "No"),
-            "D_malware_protection": st.session_state.get("D_malware_protection", "No"),
-            "D_mfa": st.session_state.get("D_mfa", "No"),
-            "D_endpoint_security": st.session_state.get("D_endpoint_security", "No"),
-            "D_backup_freq": st.session_state.get("D_backup_freq", "No regular backups"),
-            "E_ir_plan": st.session_state.get("E_ir_plan", "No"),
-            "E_incidents_5y": st.session_state.get("E_incidents_5y", "No"),
-            "E_potential_claims": st.session_state.get("E_potential_claims", "No"),
-            "F_sectors": st.session_state.get("F_sectors", []),
-            "G_options": st.session_state.get("G_options", []),
-            "H_supplier_access": st.session_state.get("H_supplier_access", "No"),
-            "H_thirdparty_policy": st.session_state.get("H_thirdparty_policy", "No"),
-            "H_contract_clauses": st.session_state.get("H_contract_clauses", "No"),
-            "H_update_policy": st.session_state.get("H_update_policy", "No"),
-            "I_dashboards": st.session_state.get("I_dashboards", "No"),
-            "I_reporting_freq": st.session_state.get("I_reporting_freq", "Ad hoc / not defined"),
-            "J_external_audit": st.session_state.get("J_external_audit", "No"),
-            "J_results_to_management": st.session_state.get("J_results_to_management", "No"),
-            "K_risky_behaviour_policy": st.session_state.get("K_risky_behaviour_policy", "No"),
-            "K_phishing_sims": st.session_state.get("K_phishing_sims", "No"),
-            "K_phishing_freq": st.session_state.get("K_phishing_freq", "Ad hoc / not defined"),
-            "L_byod_policy": st.session_state.get("L_byod_policy", "No"),
-            "L_personal_device_security": st.session_state.get("L_personal_device_security", "No"),
-        }
+        # One plain-dict copy of session_state, so each key below is a dict lookup
+        # rather than a call through the session_state proxy
+        snapshot = state.to_dict()
+
+        # responses used for scoring (B–L), snapshotted in one pass
+        responses_for_scoring = {key: snapshot.get(key, default) for key, default in SCORING_KEYS}
 
         # all answers (A–L) for the PDF
-        all_answers = {
-            "A_company_name": st.session_state.get("A_company_name", ""),
-            "A_address": st.session_state.get("A_address", ""),
-            "A_websites": st.session_state.get("A_websites", ""),
-            "A_activity": st.session_state.get("A_activity", ""),
-            "A_employees": st.session_state.get("A_employees", ""),
-            "A_revenue": st.session_state.get("A_revenue", ""),
-            "A_years": st.session_state.get("A_years", ""),
-            "A_primary_contact": st.session_state.get("A_contact", ""),
-            "B_types": st.session_state.get("B_types", []),
-            "C_infosec_policy": st.session_state.get("C_infosec_policy", ""),
-            "C_privacy_policy": st.session_state.get("C_privacy_policy", ""),
-            "C_training": st.session_state.get("C_training", ""),
-            "C_encryption": st.session_state.get("C_encryption", ""),
-            "C_encryption_details": st.session_state.get("C_encryption_details", ""),
-            "C_access_revocation": st.session_state.get("C_access_revocation", ""),
-            "C_pentesting": st.session_state.get("C_pentesting", ""),
-            "C_patch_management": st.session_state.get("C_patch_management", ""),
-            "D_firewall_ids": st.session_state.get("D_firewall_ids", ""),
-            "D_malware_protection": st.session_state.get("D_malware_protection", ""),
-            "D_mfa": st.session_state.get("D_mfa", ""),
-            "D_endpoint_security": st.session_state.get("D_endpoint_security", ""),
-            "D_backup_freq": st.session_state.get("D_backup_freq", ""),
-            "D_backup_location": st.session_state.get("D_backup_location", ""),
-            "E_ir_plan": st.session_state.get("E_ir_plan", ""),
-            "E_incidents_5y": st.session_state.get("E_incidents_5y", ""),
-            "E_incident_details": st.session_state.get("E_incident_details", ""),
-            "E_potential_claims": st.session_state.get("E_potential_claims", ""),
-            "E_claim_details": st.session_state.get("E_claim_details", ""),
-            "F_sectors": st.session_state.get("F_sectors", []),
-            "F_other": st.session_state.get("F_other", ""),
-            "G_amount": st.session_state.get("G_amount", ""),
-            "G_options": st.session_state.get("G_options", []),
-            "H_supplier_access": st.session_state.get("H_supplier_access", ""),
-            "H_thirdparty_policy": st.session_state.get("H_thirdparty_policy", ""),
-            "H_contract_clauses": st.session_state.get("H_contract_clauses", ""),
-            "H_update_policy": st.session_state.get("H_update_policy", ""),
-            "H_software_list": st.session_state.get("H_software_list", ""),
-            "I_dashboards": st.session_state.get("I_dashboards", ""),
-            "I_reporting_freq": st.session_state.get("I_reporting_freq", ""),
-            "J_external_audit": st.session_state.get("J_external_audit", ""),
-            "J_last_audit_date": st.session_state.get("J_last_audit_date", ""),
-            "J_results_to_management": st.session_state.get("J_results_to_management", ""),
-            "K_risky_behaviour_policy": st.session_state.get("K_risky_behaviour_policy", ""),
-            "K_phishing_sims": st.session_state.get("K_phishing_sims", ""),
-            "K_phishing_freq": st.session_state.get("K_phishing_freq", ""),
-            "L_byod_policy": st.session_state.get("L_byod_policy", ""),
-            "L_personal_device_security": st.session_state.get("L_personal_device_security", ""),
-        }
-
-        section_scores = calculate_section_scores(responses_for_scoring)
-        overall = calculate_overall_score(section_scores)
-        label = risk_label(overall)
-
-        if overall >= 80:
-            score_class = "score-good"
-            subtext = "This indicates a strong cyber security posture with good controls in place."
-        elif overall >= 60:
-            score_class = "score-medium"
-            subtext = "Your cyber security posture is moderate. There are controls in place, but there is room for improvement."
-        else:
-            score_class = "score-low"
-            subtext = "Your organisation appears to have a weak cyber security posture and may be exposed to significant risks."
+        all_answers = {key: snapshot.get(key, default) for key, default in ANSWER_KEYS}
+
+        section_scores, overall, label = _cached_section_scores(
+            _freeze(responses_for_scoring), WEIGHTS_KEY
+        )
+
+        # Keep the result so it survives the rerun triggered by the PDF buttons,
+        # and drop any report and file stamp from a previous submission
+        state["assessment_result"] = (all_answers, section_scores, overall, label)
+        state.pop("pdf_bytes", None)
+        state.pop("assessment_stamp", None)
+
+    if "assessment_result" in state:
+        all_answers, section_scores, overall, label = state["assessment_result"]
+        scores_tuple = _freeze(section_scores)
+
+        score_class, subtext = _SCORE_BUCKETS[bisect_right(_STATUS_THRESHOLDS, overall)]
 
         st.markdown("## Result")
         st.progress(min(1.0, overall / 100.0))
 
         st.markdown(
-            f"""
-            <div class="score-card {score_class}">
-                <div class="score-card-title">Overall Cyber Security Score</div>
-                <div class="score-card-value">{overall:.1f} / 100</div>
-                <div class="score-card-label"><strong>{label}</strong></div>
-                <div class="score-subtext">{subtext}</div>
-            </div>
-            """,
+            _SCORE_CARD_TPL.substitute(
+                score_class=score_class, overall=f"{overall:.1f}", label=label, subtext=subtext
+            ),
             unsafe_allow_html=True,
         )
 
@@ -1091,7 +1297,7 @@ def main():
         with viz_col1:
             st.markdown("#### Performance by Section")
             if PLOTLY_AVAILABLE:
-                radar_fig = create_radar_chart(section_scores)
+                radar_fig = _cached_radar_chart(scores_tuple)
                 if radar_fig:
                     st.plotly_chart(radar_fig, use_container_width=True)
             else:
@@ -1100,7 +1306,7 @@ def main():
         with viz_col2:
             st.markdown("#### Weighted Section Scores")
             if PLOTLY_AVAILABLE:
-                bar_fig = create_section_bar_chart(section_scores)
+                bar_fig = _cached_bar_chart(scores_tuple, WEIGHTS_KEY)
                 if bar_fig:
                     st.plotly_chart(bar_fig, use_container_width=True)
             else:
@@ -1109,74 +1315,52 @@ def main():
         # Detailed section scores table
         st.markdown("### 📋 Detailed Section Scores")
         
-        section_names = {
-            "B": "Data & Sensitive Information",
-            "C": "Policies & Governance",
-            "D": "Infrastructure & IT Controls",
-            "E": "Incident Response",
-            "F": "Sector Risk Profile",
-            "G": "Coverage Awareness",
-            "H": "Third-Party Security",
-            "I": "Monitoring & KPIs",
-            "J": "Tests & Audits",
-            "K": "Security Culture",
-            "L": "Mobile & BYOD"
-        }
-        
-        # Sort by weight (descending)
-        sorted_sections = sorted(section_scores.keys(), 
-                               key=lambda x: SECTION_WEIGHTS[x], 
-                               reverse=True)
-        
-        for sec in sorted_sections:
-            weight_pct = SECTION_WEIGHTS[sec] * 100
-            score = section_scores[sec]
-            
-            if score >= 80:
-                emoji = "✅"
-                color = "#1e8e3e"
-            elif score >= 60:
-                emoji = "⚠️"
-                color = "#fbbc04"
-            else:
-                emoji = "❌"
-                color = "#d93025"
-            
-            st.markdown(
-                f"""
-                <div style="padding: 0.75rem; margin: 0.5rem 0; background: #f9f9f9; border-radius: 8px; border-left: 4px solid {color};">
-                    <strong>{emoji} Section {sec}: {section_names[sec]}</strong><br/>
-                    Score: <strong>{score:.1f}/100</strong> | Weight: <strong>{weight_pct:.0f}%</strong> | Contribution: <strong>{score * SECTION_WEIGHTS[sec]:.1f}</strong> points
-                </div>
-                """,
-                unsafe_allow_html=True
+        # Sorted by weight (descending), in one bordered container and a single markdown element
+        sorted_scores = np.fromiter(
+            (section_scores[sec] for sec in SORTED_SECTIONS_BY_WEIGHT), dtype=np.float64
+        )
+        contributions = sorted_scores * SORTED_WEIGHTS_VEC
+        cards = []
+        for sec, score, weight_pct, contribution in zip(
+            SORTED_SECTIONS_BY_WEIGHT,
+            sorted_scores.tolist(),
+            SORTED_WEIGHT_PCT_VEC.tolist(),
+            contributions.tolist(),
+        ):
+            emoji, color = STATUS[bisect_right(_STATUS_THRESHOLDS, score)]
+            cards.append(
+                f"**{emoji} Section {sec}: {SECTION_TITLES[sec]}**  \n"
+                f"Score: :{color}[**{score:.1f}/100**] | Weight: **{weight_pct:.0f}%** | "
+                f"Contribution: **{contribution:.1f}** points"
             )
+        with st.container(border=True):
+            st.markdown("\n\n".join(cards))
         
         # Key insights
         st.markdown("### 💡 Key Insights")
         
-        # Find strengths and weaknesses
-        strengths = [sec for sec, score in section_scores.items() if score >= 80]
-        weaknesses = [sec for sec, score in section_scores.items() if score < 60]
+        # Find strengths, weaknesses and low-scoring critical sections in one pass
+        strengths, weaknesses, critical_low = [], [], []
+        for sec, score in section_scores.items():
+            if score >= 80:
+                strengths.append(sec)
+            elif score < 60:
+                weaknesses.append(sec)
+            if score < 70 and sec in _CRITICAL_SECTIONS:
+                critical_low.append(sec)
         
         if strengths:
-            st.success(f"**Strengths:** Your organisation performs well in: {', '.join([section_names[s] for s in strengths])}")
+            st.success(f"**Strengths:** Your organisation performs well in: {', '.join([SECTION_TITLES[s] for s in strengths])}")
         
         if weaknesses:
-            st.error(f"**Areas for Improvement:** Focus on: {', '.join([section_names[s] for s in weaknesses])}")
+            st.error(f"**Areas for Improvement:** Focus on: {', '.join([SECTION_TITLES[s] for s in weaknesses])}")
         
         # Highlight critical sections
-        critical_low = [sec for sec in ["C", "D", "E"] if section_scores[sec] < 70]
         if critical_low:
             st.warning(f"⚠️ **Critical Priority:** Sections {', '.join(critical_low)} are high-weight areas with low scores. Improving these will significantly boost your overall score.")
 
         # ---------- SECTION 3: EXPORT PDF ----------
-        st.markdown(
-            """
-            <div style="margin-top: 2.5rem; border-top: 2px solid #e5e7eb; padding-top: 1rem;"></div>
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_SECTION3_SEPARATOR_HTML, unsafe_allow_html=True)
         st.markdown("## 3. Export PDF Report")
 
         if not REPORTLAB_AVAILABLE:
@@ -1185,14 +1369,26 @@ def main():
                 "Please install it with `pip install reportlab` and rerun the app."
             )
         else:
-            pdf_buffer = generate_pdf(all_answers, section_scores, overall, label)
-            st.download_button(
-                label="📥 Download PDF Report",
-                data=pdf_buffer,
-                file_name=f"cyber_security_assessment_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-            )
+            # The report is only built on request, not on every submit
+            if st.button("📄 Prepare PDF Report", use_container_width=True):
+                # Hashable snapshot of the answers in PDF order (multiselect lists become tuples)
+                answers_tuple = tuple(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in all_answers.items()
+                )
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+                state["pdf_bytes"] = _cached_pdf(answers_tuple, scores_tuple, overall, label, timestamp)
+
+            if "pdf_bytes" in state:
+                # Stamped once per submission so the file name is stable across reruns
+                stamp = state.setdefault("assessment_stamp", datetime.now().strftime("%Y%m%d_%H%M"))
+                st.download_button(
+                    label="📥 Download PDF Report",
+                    data=state["pdf_bytes"],
+                    file_name=f"cyber_security_assessment_{stamp}.pdf",
+                    mime="application/pdf",
+                    use_container_width=True,
+                )
 
 
 if __name__ == "__main__":